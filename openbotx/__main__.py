@@ -19,6 +19,7 @@ from openbotx.core.gateway_manager import get_gateway_manager
 from openbotx.core.orchestrator import get_orchestrator
 from openbotx.helpers.browser_cleanup import close_browser_tools
 from openbotx.helpers.config import get_config, load_config
+from openbotx.helpers.event_loop import run
 from openbotx.helpers.gateway_loader import setup_gateways
 from openbotx.helpers.logger import get_logger
 from openbotx.helpers.memory_loader import initialize_memory_index
@@ -157,7 +158,7 @@ def main() -> None:
         os.environ["OPENBOTX_WS_HOST"] = args.host
 
     try:
-        asyncio.run(run_application(args.gateway, args.config))
+        run(run_application(args.gateway, args.config))
     except KeyboardInterrupt:
         print("\nInterrupted by user")
         sys.exit(0)
@@ -1,6 +1,5 @@
 """CLI commands for OpenBotX."""
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -48,7 +47,9 @@ def start(host: str, port: int, reload: bool, cli_mode: bool) -> None:
 
     if cli_mode:
         # Start in CLI interactive mode
-        asyncio.run(_run_cli_mode(config))
+        from openbotx.helpers.event_loop import run
+
+        run(_run_cli_mode(config))
     else:
         # Start API server
         import uvicorn
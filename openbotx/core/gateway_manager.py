@@ -167,6 +167,7 @@ class GatewayManager:
                     self._run_gateway_wrapper(name),
                     name=f"gateway-{name}",
                 )
+                info.gateway.run_task = info.task
 
             info.status = GatewayStatus.RUNNING
             info.started_at = datetime.now(UTC)
@@ -1,6 +1,7 @@
 """Memory index for OpenBotX - vector-based memory with hybrid search."""
 
 import hashlib
+import heapq
 import os
 import sqlite3
 import struct
@@ -11,6 +12,7 @@ from typing import Any
 from openbotx.helpers.logger import get_logger
 from openbotx.helpers.tokens import count_tokens
 from openbotx.models.memory import (
+    MEMORY_SOURCE_BY_VALUE,
     Chunk,
     MemorySearchResult,
     MemorySource,
@@ -18,15 +20,43 @@ from openbotx.models.memory import (
 )
 from openbotx.providers.embedding.base import EmbeddingProvider
 
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:  # numpy ships with sentence-transformers; keep a pure-Python fallback
+    _HAS_NUMPY = False
+
+
+def _content_hash(text: str) -> str:
+    """Short content hash (first 8 bytes of SHA-256 as hex) for change detection."""
+    return hashlib.sha256(text.encode()).digest()[:8].hex()
+
 
 def _serialize_embedding(embedding: list[float]) -> bytes:
-    """Serialize embedding to bytes for sqlite-vec."""
+    """Serialize embedding to float32 bytes for sqlite-vec."""
     return struct.pack(f"{len(embedding)}f", *embedding)
 
 
-def _deserialize_embedding(data: bytes, dimensions: int) -> list[float]:
-    """Deserialize embedding from bytes."""
-    return list(struct.unpack(f"{dimensions}f", data))
+# Element type of chunks.embedding blobs; rows written before the column existed are float32
+_EMBEDDING_F16 = "f16"
+_EMBEDDING_F32 = "f32"
+_EMBEDDING_FORMATS = {_EMBEDDING_F16: "e", _EMBEDDING_F32: "f"}
+
+
+def _serialize_embedding_half(embedding: list[float]) -> bytes:
+    """Serialize embedding to float16 bytes for the chunks table (half the size of float32)."""
+    if _HAS_NUMPY:
+        data: bytes = np.asarray(embedding, dtype=np.float16).tobytes()
+        return data
+    return struct.pack(f"{len(embedding)}e", *embedding)
+
+
+def _deserialize_embedding(
+    data: bytes, dimensions: int, dtype: str = _EMBEDDING_F32
+) -> list[float]:
+    """Deserialize embedding from bytes of the given element type (f16 or f32)."""
+    return list(struct.unpack(f"{dimensions}{_EMBEDDING_FORMATS[dtype]}", data))
 
 
 def _cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -41,6 +71,32 @@ def _cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
+def _cosine_similarities(
+    query: list[float], blobs: list[bytes], dimensions: int, dtype: str = _EMBEDDING_F32
+) -> list[float]:
+    """Cosine similarity of a query against many serialized embeddings.
+
+    With numpy the blobs are viewed as one matrix and scored with a single
+    matrix-vector product; without it, falls back to the per-vector Python loop.
+    All blobs must share the given element type (f16 or f32).
+    """
+    if not _HAS_NUMPY:
+        return [
+            _cosine_similarity(query, _deserialize_embedding(blob, dimensions, dtype))
+            for blob in blobs
+        ]
+
+    np_dtype = np.float16 if dtype == _EMBEDDING_F16 else np.float32
+    matrix = np.frombuffer(b"".join(blobs), dtype=np_dtype).reshape(len(blobs), dimensions)
+    matrix = matrix.astype(np.float32, copy=False)
+    q = np.asarray(query, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(q)
+    dots = matrix @ q
+    scores = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    similarities: list[float] = scores.tolist()
+    return similarities
+
+
 class MemoryIndex:
     """
     Vector-based memory system using SQLite + sqlite-vec.
@@ -154,12 +210,18 @@ class MemoryIndex:
                 hash TEXT NOT NULL,
                 text TEXT NOT NULL,
                 embedding BLOB,
+                embedding_dtype TEXT,
                 updated_at TEXT NOT NULL,
                 FOREIGN KEY (path) REFERENCES files(path) ON DELETE CASCADE
             )
         """
         )
 
+        # databases created before embedding_dtype existed only hold float32 blobs
+        columns = {row["name"] for row in cursor.execute("PRAGMA table_info(chunks)")}
+        if "embedding_dtype" not in columns:
+            cursor.execute("ALTER TABLE chunks ADD COLUMN embedding_dtype TEXT")
+
         # create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_chunks_path ON chunks(path)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_chunks_source ON chunks(source)")
@@ -243,7 +305,7 @@ class MemoryIndex:
             return 0
 
         # calculate hash
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+        content_hash = _content_hash(content)
 
         # check if already indexed with same hash
         cursor = self._conn.cursor()
@@ -277,11 +339,14 @@ class MemoryIndex:
         # insert chunks
         now = datetime.now(UTC).isoformat()
         for chunk, embedding in zip(chunks, embeddings, strict=False):
-            chunk.embedding = embedding
+            chunk.embedding = _serialize_embedding(embedding)
             cursor.execute(
                 """
-                INSERT INTO chunks (path, source, start_line, end_line, hash, text, embedding, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO chunks (
+                    path, source, start_line, end_line, hash, text,
+                    embedding, embedding_dtype, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     chunk.path,
@@ -290,7 +355,8 @@ class MemoryIndex:
                     chunk.end_line,
                     chunk.hash,
                     chunk.text,
-                    _serialize_embedding(embedding),
+                    _serialize_embedding_half(embedding),
+                    _EMBEDDING_F16,
                     now,
                 ),
             )
@@ -301,7 +367,7 @@ class MemoryIndex:
                 try:
                     cursor.execute(
                         "INSERT INTO chunks_vec (chunk_id, embedding) VALUES (?, ?)",
-                        (chunk_id, _serialize_embedding(embedding)),
+                        (chunk_id, chunk.embedding),
                     )
                 except Exception as e:
                     self._logger.warning("vec_insert_error", chunk_id=chunk_id, error=str(e))
@@ -338,7 +404,7 @@ class MemoryIndex:
         Returns:
             Number of chunks created
         """
-        content_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
+        content_hash = _content_hash(text)
 
         cursor = self._conn.cursor()
 
@@ -363,8 +429,11 @@ class MemoryIndex:
         for chunk, embedding in zip(chunks, embeddings, strict=False):
             cursor.execute(
                 """
-                INSERT INTO chunks (path, source, start_line, end_line, hash, text, embedding, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO chunks (
+                    path, source, start_line, end_line, hash, text,
+                    embedding, embedding_dtype, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     chunk.path,
@@ -373,7 +442,8 @@ class MemoryIndex:
                     chunk.end_line,
                     chunk.hash,
                     chunk.text,
-                    _serialize_embedding(embedding),
+                    _serialize_embedding_half(embedding),
+                    _EMBEDDING_F16,
                     now,
                 ),
             )
@@ -414,10 +484,10 @@ class MemoryIndex:
             # if adding this line exceeds chunk size, save current chunk
             if current_chunk_tokens + line_tokens > self._chunk_size and current_chunk_lines:
                 chunk_text = "\n".join(current_chunk_lines)
-                chunk_hash = hashlib.sha256(chunk_text.encode()).hexdigest()[:16]
+                chunk_hash = _content_hash(chunk_text)
 
                 chunks.append(
-                    Chunk(
+                    Chunk.model_construct(
                         path=path,
                         source=source,
                         start_line=start_line,
@@ -447,10 +517,10 @@ class MemoryIndex:
         # save remaining chunk
         if current_chunk_lines:
             chunk_text = "\n".join(current_chunk_lines)
-            chunk_hash = hashlib.sha256(chunk_text.encode()).hexdigest()[:16]
+            chunk_hash = _content_hash(chunk_text)
 
             chunks.append(
-                Chunk(
+                Chunk.model_construct(
                     path=path,
                     source=source,
                     start_line=start_line,
@@ -521,24 +591,29 @@ class MemoryIndex:
             if combined_score >= min_score:
                 combined.append((chunk_id, combined_score))
 
-        # sort by score
-        combined.sort(key=lambda x: x[1], reverse=True)
+        # keep only the top results; no need to sort every candidate
+        top = heapq.nlargest(max_results, combined, key=lambda x: x[1])
+        if not top:
+            return []
 
-        # fetch chunk details
-        results = []
+        # fetch chunk details for the top results in one query
         cursor = self._conn.cursor()
-        for chunk_id, score in combined[:max_results]:
-            cursor.execute(
-                "SELECT path, source, start_line, end_line, text FROM chunks WHERE id = ?",
-                (chunk_id,),
-            )
-            row = cursor.fetchone()
+        placeholders = ",".join("?" * len(top))
+        cursor.execute(
+            f"SELECT id, path, source, start_line, end_line, text FROM chunks WHERE id IN ({placeholders})",
+            [chunk_id for chunk_id, _ in top],
+        )
+        rows = {row["id"]: row for row in cursor.fetchall()}
+
+        results = []
+        for chunk_id, score in top:
+            row = rows.get(chunk_id)
             if row:
                 snippet = self._generate_snippet(row["text"], query)
                 results.append(
-                    MemorySearchResult(
+                    MemorySearchResult.model_construct(
                         path=row["path"],
-                        source=MemorySource(row["source"]),
+                        source=MEMORY_SOURCE_BY_VALUE[row["source"]],
                         start_line=row["start_line"],
                         end_line=row["end_line"],
                         score=score,
@@ -560,38 +635,41 @@ class MemoryIndex:
         if dims == 0:
             return []
 
+        # the stored element type decides the expected blob size, so vectors from a model
+        # with other dimensions are skipped instead of being misread; NULL means float32
+        sql = """
+            SELECT id, embedding, COALESCE(embedding_dtype, ?) AS dtype FROM chunks
+            WHERE embedding IS NOT NULL
+            AND LENGTH(embedding) = CASE COALESCE(embedding_dtype, ?) WHEN ? THEN ? ELSE ? END
+        """
+        params: list[Any] = [_EMBEDDING_F32, _EMBEDDING_F32, _EMBEDDING_F16, dims * 2, dims * 4]
         if sources:
             source_values = [s.value for s in sources]
             placeholders = ",".join(["?" for _ in source_values])
-            cursor.execute(
-                f"""
-                SELECT id, embedding FROM chunks
-                WHERE embedding IS NOT NULL AND LENGTH(embedding) = ? AND source IN ({placeholders})
-                """,
-                (dims * 4, *source_values),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT id, embedding FROM chunks
-                WHERE embedding IS NOT NULL AND LENGTH(embedding) = ?
-                """,
-                (dims * 4,),
-            )
+            sql += f" AND source IN ({placeholders})"
+            params.extend(source_values)
+        cursor.execute(sql, params)
 
-        scored = []
+        rows_by_dtype: dict[str, list[sqlite3.Row]] = {}
         for row in cursor.fetchall():
+            rows_by_dtype.setdefault(row["dtype"], []).append(row)
+
+        scored: list[tuple[int, float]] = []
+        for dtype, rows in rows_by_dtype.items():
+            if dtype not in _EMBEDDING_FORMATS:
+                continue
             try:
-                emb = _deserialize_embedding(row["embedding"], dims)
-                score = _cosine_similarity(query_embedding, emb)
-                if not (0 <= score <= 1):
-                    score = max(0, min(1, score))
-                scored.append((row["id"], score))
-            except (struct.error, TypeError):
+                scores = _cosine_similarities(
+                    query_embedding, [row["embedding"] for row in rows], dims, dtype
+                )
+            except (struct.error, TypeError, ValueError):
                 continue
+            scored.extend(
+                (row["id"], max(0.0, min(1.0, score)))
+                for row, score in zip(rows, scores, strict=True)
+            )
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:limit]
+        return heapq.nlargest(limit, scored, key=lambda x: x[1])
 
     def _vector_search(
         self,
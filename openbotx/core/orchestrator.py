@@ -397,7 +397,7 @@ class Orchestrator:
         # Filter using tool policy
         return tool_policy.get_tool_names(tool_infos, profile, elevated)
 
-    def _get_gateway_capabilities(self, gateway_type: GatewayType) -> set[ResponseCapability]:
+    def _get_gateway_capabilities(self, gateway_type: GatewayType) -> frozenset[ResponseCapability]:
         """Get capabilities of a specific gateway.
 
         Args:
@@ -415,7 +415,7 @@ class Orchestrator:
                     return gateway.response_capabilities
 
         # Default: text only
-        return {ResponseCapability.TEXT}
+        return GatewayProvider.RESPONSE_CAPS
 
     async def _trigger_summarization(self, channel_id: str) -> None:
         """Trigger summarization for a channel in background.
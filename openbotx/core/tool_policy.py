@@ -6,47 +6,56 @@ Implements tool profiles and groups:
 - Allowlists and denylists for fine-grained control
 """
 
+import logging
 from dataclasses import dataclass, field
 from typing import Any
 
-from openbotx.helpers.logger import get_logger
+from openbotx.helpers.logger import get_logger, is_enabled_for
 from openbotx.models.enums import ToolGroup, ToolProfile
 
 logger = get_logger("tool_policy")
 
 
 # Default tool groups for each profile
-PROFILE_GROUPS: dict[ToolProfile, set[ToolGroup]] = {
-    ToolProfile.MINIMAL: {
-        ToolGroup.SYSTEM,
-    },
-    ToolProfile.CODING: {
-        ToolGroup.SYSTEM,
-        ToolGroup.FS,
-        ToolGroup.DATABASE,
-    },
-    ToolProfile.MESSAGING: {
-        ToolGroup.SYSTEM,
-        ToolGroup.MESSAGING,
-        ToolGroup.WEB,
-    },
-    ToolProfile.FULL: {
-        ToolGroup.SYSTEM,
-        ToolGroup.FS,
-        ToolGroup.WEB,
-        ToolGroup.MEMORY,
-        ToolGroup.SESSIONS,
-        ToolGroup.UI,
-        ToolGroup.AUTOMATION,
-        ToolGroup.MESSAGING,
-        ToolGroup.DATABASE,
-        ToolGroup.STORAGE,
-        ToolGroup.SCHEDULER,
-    },
+PROFILE_GROUPS: dict[ToolProfile, frozenset[ToolGroup]] = {
+    ToolProfile.MINIMAL: frozenset(
+        {
+            ToolGroup.SYSTEM,
+        }
+    ),
+    ToolProfile.CODING: frozenset(
+        {
+            ToolGroup.SYSTEM,
+            ToolGroup.FS,
+            ToolGroup.DATABASE,
+        }
+    ),
+    ToolProfile.MESSAGING: frozenset(
+        {
+            ToolGroup.SYSTEM,
+            ToolGroup.MESSAGING,
+            ToolGroup.WEB,
+        }
+    ),
+    ToolProfile.FULL: frozenset(
+        {
+            ToolGroup.SYSTEM,
+            ToolGroup.FS,
+            ToolGroup.WEB,
+            ToolGroup.MEMORY,
+            ToolGroup.SESSIONS,
+            ToolGroup.UI,
+            ToolGroup.AUTOMATION,
+            ToolGroup.MESSAGING,
+            ToolGroup.DATABASE,
+            ToolGroup.STORAGE,
+            ToolGroup.SCHEDULER,
+        }
+    ),
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolPolicyConfig:
     """Configuration for tool policy."""
 
@@ -54,30 +63,78 @@ class ToolPolicyConfig:
     allowlist: list[str] = field(default_factory=list)
     denylist: list[str] = field(default_factory=list)
     group_overrides: dict[ToolGroup, bool] = field(default_factory=dict)
-    approval_required_tools: list[str] = field(default_factory=list)
-    dangerous_tools: list[str] = field(default_factory=list)
+    approval_required_tools: frozenset[str] = field(default_factory=frozenset)
+    dangerous_tools: frozenset[str] = field(default_factory=frozenset)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInfo:
     """Information about a tool for policy evaluation."""
 
     name: str
     group: ToolGroup | None = None
-    groups: list[ToolGroup] = field(default_factory=list)
+    groups: frozenset[ToolGroup] = field(default_factory=frozenset)
     approval_required: bool = False
     dangerous: bool = False
     admin_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True, init=False, repr=False, eq=False)
 class ToolPolicyResult:
-    """Result of tool policy evaluation."""
+    """Result of tool policy evaluation.
+
+    Accepts either a ready ``reason`` string or a ``reason_template`` with
+    ``reason_args`` that is only formatted when the reason is read. repr and
+    equality use the formatted reason, however it was given.
+    """
 
     allowed: bool
-    reason: str
-    requires_approval: bool = False
-    requires_elevation: bool = False
+    reason_template: str
+    reason_args: tuple[Any, ...]
+    requires_approval: bool
+    requires_elevation: bool
+
+    def __init__(
+        self,
+        allowed: bool,
+        reason: str | None = None,
+        requires_approval: bool = False,
+        requires_elevation: bool = False,
+        *,
+        reason_template: str = "",
+        reason_args: tuple[Any, ...] = (),
+    ) -> None:
+        self.allowed = allowed
+        if reason is not None:
+            reason_template, reason_args = reason, ()
+        self.reason_template = reason_template
+        self.reason_args = reason_args
+        self.requires_approval = requires_approval
+        self.requires_elevation = requires_elevation
+
+    @property
+    def reason(self) -> str:
+        """Human-readable reason, formatted only when accessed."""
+        if not self.reason_args:
+            return self.reason_template
+        return self.reason_template % self.reason_args
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolPolicyResult(allowed={self.allowed!r}, reason={self.reason!r}, "
+            f"requires_approval={self.requires_approval!r}, "
+            f"requires_elevation={self.requires_elevation!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ToolPolicyResult):
+            return NotImplemented
+        return (
+            self.allowed == other.allowed
+            and self.requires_approval == other.requires_approval
+            and self.requires_elevation == other.requires_elevation
+            and self.reason == other.reason
+        )
 
 
 class ToolPolicy:
@@ -99,7 +156,7 @@ class ToolPolicy:
         self.config = config or ToolPolicyConfig()
         self._logger = get_logger("tool_policy")
 
-    def get_allowed_groups(self, profile: ToolProfile) -> set[ToolGroup]:
+    def get_allowed_groups(self, profile: ToolProfile) -> frozenset[ToolGroup]:
         """Get allowed tool groups for a profile.
 
         Args:
@@ -108,16 +165,20 @@ class ToolPolicy:
         Returns:
             Set of allowed tool groups
         """
-        groups = PROFILE_GROUPS.get(profile, set()).copy()
+        base_groups = PROFILE_GROUPS.get(profile, frozenset())
+        if not self.config.group_overrides:
+            return base_groups
+
+        groups = set(base_groups)
 
         # Apply group overrides
         for group, allowed in self.config.group_overrides.items():
             if allowed:
                 groups.add(group)
-            elif group in groups:
-                groups.remove(group)
+            else:
+                groups.discard(group)
 
-        return groups
+        return frozenset(groups)
 
     def evaluate(
         self,
@@ -139,14 +200,16 @@ class ToolPolicy:
         if tool.name in self.config.denylist:
             return ToolPolicyResult(
                 allowed=False,
-                reason=f"Tool '{tool.name}' is in denylist",
+                reason_template="Tool '%s' is in denylist",
+                reason_args=(tool.name,),
             )
 
         # Check explicit allowlist
         if tool.name in self.config.allowlist:
             return ToolPolicyResult(
                 allowed=True,
-                reason=f"Tool '{tool.name}' is in allowlist",
+                reason_template="Tool '%s' is in allowlist",
+                reason_args=(tool.name,),
                 requires_approval=tool.approval_required,
             )
 
@@ -154,7 +217,8 @@ class ToolPolicy:
         if tool.admin_only and not elevated:
             return ToolPolicyResult(
                 allowed=False,
-                reason=f"Tool '{tool.name}' requires admin privileges",
+                reason_template="Tool '%s' requires admin privileges",
+                reason_args=(tool.name,),
                 requires_elevation=True,
             )
 
@@ -163,7 +227,8 @@ class ToolPolicy:
             if not elevated:
                 return ToolPolicyResult(
                     allowed=False,
-                    reason=f"Tool '{tool.name}' is marked as dangerous",
+                    reason_template="Tool '%s' is marked as dangerous",
+                    reason_args=(tool.name,),
                     requires_elevation=True,
                 )
 
@@ -175,36 +240,42 @@ class ToolPolicy:
             if profile == ToolProfile.FULL:
                 return ToolPolicyResult(
                     allowed=True,
-                    reason="Tool has no group, allowed in FULL profile",
+                    reason_template="Tool has no group, allowed in FULL profile",
                     requires_approval=tool.approval_required,
                 )
             else:
                 return ToolPolicyResult(
                     allowed=False,
-                    reason=f"Tool '{tool.name}' has no group and profile is not FULL",
+                    reason_template="Tool '%s' has no group and profile is not FULL",
+                    reason_args=(tool.name,),
                 )
 
         # Check if tool's group is allowed
         if tool.group and tool.group in allowed_groups:
             return ToolPolicyResult(
                 allowed=True,
-                reason=f"Tool group '{tool.group.value}' is allowed in profile '{profile.value}'",
+                reason_template="Tool group '%s' is allowed in profile '%s'",
+                reason_args=(tool.group.value, profile.value),
                 requires_approval=tool.approval_required,
             )
 
         # Check if any of tool's groups are allowed
-        for group in tool.groups:
-            if group in allowed_groups:
-                return ToolPolicyResult(
-                    allowed=True,
-                    reason=f"Tool group '{group.value}' is allowed in profile '{profile.value}'",
-                    requires_approval=tool.approval_required,
-                )
+        matched_groups = tool.groups & allowed_groups
+        if matched_groups:
+            # report the first match in declared group order so the reason is stable
+            group = next(g for g in ToolGroup if g in matched_groups)
+            return ToolPolicyResult(
+                allowed=True,
+                reason_template="Tool group '%s' is allowed in profile '%s'",
+                reason_args=(group.value, profile.value),
+                requires_approval=tool.approval_required,
+            )
 
         # Default: not allowed
         return ToolPolicyResult(
             allowed=False,
-            reason=f"Tool '{tool.name}' is not allowed in profile '{profile.value}'",
+            reason_template="Tool '%s' is not allowed in profile '%s'",
+            reason_args=(tool.name, profile.value),
         )
 
     def filter_tools(
@@ -224,17 +295,23 @@ class ToolPolicy:
             List of allowed tools
         """
         allowed_tools = []
+        denied: list[tuple[str, ToolPolicyResult]] = []
+        # one level check per call; denied tools are only collected when debug is on
+        debug_enabled = is_enabled_for("tool_policy", logging.DEBUG)
 
         for tool in tools:
             result = self.evaluate(tool, profile, elevated)
             if result.allowed:
                 allowed_tools.append(tool)
-            else:
-                self._logger.debug(
-                    "tool_filtered",
-                    tool=tool.name,
-                    reason=result.reason,
-                )
+            elif debug_enabled:
+                denied.append((tool.name, result))
+
+        if denied:
+            # reasons are formatted here, only once debug output is known to be wanted
+            self._logger.debug(
+                "tools_filtered_denied",
+                denied=[(name, result.reason) for name, result in denied],
+            )
 
         self._logger.info(
             "tools_filtered",
@@ -274,23 +351,18 @@ def create_tool_info_from_definition(definition: Any) -> ToolInfo:
     Returns:
         ToolInfo instance
     """
-    group = None
-    groups: list[ToolGroup] = []
-
-    if hasattr(definition, "group") and definition.group:
-        group = definition.group
-
-    if hasattr(definition, "groups") and definition.groups:
-        groups = definition.groups
+    group = getattr(definition, "group", None) or None
+    groups = frozenset(getattr(definition, "groups", None) or ())
 
     approval_required = False
     dangerous = False
     admin_only = False
 
-    if hasattr(definition, "security") and definition.security:
-        approval_required = getattr(definition.security, "approval_required", False)
-        dangerous = getattr(definition.security, "dangerous", False)
-        admin_only = getattr(definition.security, "admin_only", False)
+    security = getattr(definition, "security", None)
+    if security:
+        approval_required = getattr(security, "approval_required", False)
+        dangerous = getattr(security, "dangerous", False)
+        admin_only = getattr(security, "admin_only", False)
 
     return ToolInfo(
         name=definition.name,
@@ -24,10 +24,19 @@ def _service_relay(config: Config) -> Any:
     return run_relay_server(host=config.relay.host, port=config.relay.port)
 
 
-# name, enabled(config), start_fn(config) -> coroutine that runs until cancelled
-_SERVICES: list[tuple[str, Callable[[Config], bool], Callable[[Config], Any]]] = [
+def _service_browser_prewarm(config: Config) -> Any:
+    """Browser prewarm: returns coroutine that finishes once the browser is launched."""
+    from openbotx.tools.browser_tool import prewarm_browser
+
+    return prewarm_browser()
+
+
+# name, enabled(config), start_fn(config) -> coroutine run as a task; long-lived services
+# run until stop_background_services() cancels them, one-shot ones simply finish
+_SERVICES: tuple[tuple[str, Callable[[Config], bool], Callable[[Config], Any]], ...] = (
     ("relay", lambda c: c.relay.enabled, _service_relay),
-]
+    ("browser_prewarm", lambda c: c.browser.prewarm, _service_browser_prewarm),
+)
 
 
 async def start_background_services(config: Config | None = None) -> list[str]:
@@ -57,16 +66,19 @@ async def start_background_services(config: Config | None = None) -> list[str]:
 
 
 async def stop_background_services() -> None:
-    """Stop all running background services (same pattern as stop_all_gateways)."""
+    """Stop all running background services (same pattern as stop_all_gateways).
+
+    All tasks are cancelled first and then drained together, so shutdown takes as
+    long as the slowest service instead of the sum of all of them.
+    """
     global _running
-    for name, task in _running:
-        try:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+    running, _running = _running, []
+    for _, task in running:
+        task.cancel()
+
+    results = await asyncio.gather(*(task for _, task in running), return_exceptions=True)
+    for (name, _), result in zip(running, results, strict=True):
+        if isinstance(result, Exception):
+            _logger.error("background_service_stop_error", service=name, error=str(result))
+        else:
             _logger.info("background_service_stopped", service=name)
-        except Exception as e:
-            _logger.error("background_service_stop_error", service=name, error=str(e))
-    _running = []
@@ -1,6 +1,7 @@
 """Close Playwright/browser resources on app shutdown so the Node process exits."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 
 from openbotx.helpers.logger import get_logger
 
@@ -9,25 +10,35 @@ logger = get_logger("browser_cleanup")
 _SHUTDOWN_TIMEOUT = 5.0
 
 
-async def close_browser_tools() -> None:
-    """Close browser and CDP resources (Playwright/Node). Call once on app shutdown.
+async def _close_browser() -> None:
+    from openbotx.tools.browser_tool import close_browser_resources
 
-    Uses a short timeout so if the Node process hangs, we do not block shutdown forever.
-    """
-    try:
-        from openbotx.tools.browser_tool import close_browser_resources
+    await close_browser_resources()
 
-        await asyncio.wait_for(close_browser_resources(), timeout=_SHUTDOWN_TIMEOUT)
-    except TimeoutError:
-        logger.warning("browser_cleanup_timeout", which="browser", timeout=_SHUTDOWN_TIMEOUT)
-    except Exception as e:
-        logger.debug("browser_cleanup_error", which="browser", error=str(e))
 
-    try:
-        from openbotx.tools.cdp_tool import close_cdp_resources
+async def _close_cdp() -> None:
+    from openbotx.tools.cdp_tool import close_cdp_resources
+
+    await close_cdp_resources()
 
-        await asyncio.wait_for(close_cdp_resources(), timeout=_SHUTDOWN_TIMEOUT)
+
+async def _close_with_timeout(which: str, close_fn: Callable[[], Awaitable[None]]) -> None:
+    """Run one close function with the shutdown timeout, logging instead of raising."""
+    try:
+        await asyncio.wait_for(close_fn(), timeout=_SHUTDOWN_TIMEOUT)
     except TimeoutError:
-        logger.warning("browser_cleanup_timeout", which="cdp", timeout=_SHUTDOWN_TIMEOUT)
+        logger.warning("browser_cleanup_timeout", which=which, timeout=_SHUTDOWN_TIMEOUT)
     except Exception as e:
-        logger.debug("browser_cleanup_error", which="cdp", error=str(e))
+        logger.debug("browser_cleanup_error", which=which, error=str(e))
+
+
+async def close_browser_tools() -> None:
+    """Close browser and CDP resources (Playwright/Node). Call once on app shutdown.
+
+    Both are closed concurrently with a short timeout each, so if the Node process
+    hangs we do not block shutdown for longer than a single timeout.
+    """
+    await asyncio.gather(
+        _close_with_timeout("browser", _close_browser),
+        _close_with_timeout("cdp", _close_cdp),
+    )
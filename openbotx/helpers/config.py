@@ -19,8 +19,17 @@ from openbotx.models.enums import (
     TTSProviderType,
 )
 
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = get_logger("config")
 
+# Match ${VAR_NAME} pattern
+_ENV_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+# Trailing slashes and an optional /chat/completions suffix on LLM base URLs
+_LLM_URL_TAIL = re.compile(r"/*(?:/chat/completions)?/*$")
+
 
 class BotConfig(BaseModel):
     """Bot identity configuration."""
@@ -87,11 +96,7 @@ def _normalize_llm_base_url(url: str | None) -> str | None:
     """Strip trailing slash and /chat/completions from LLM base URL."""
     if not url or not url.strip():
         return None
-    u = url.strip().rstrip("/")
-    for suffix in ("/chat/completions", "/v1/chat/completions"):
-        if u.endswith(suffix):
-            u = u[: -len(suffix)].rstrip("/")
-            break
+    u = _LLM_URL_TAIL.sub("", url.strip(), count=1)
     return u or None
 
 
@@ -156,6 +161,12 @@ class RelayConfig(BaseModel):
     port: int = 18792
 
 
+class BrowserConfig(BaseModel):
+    """Browser tools configuration."""
+
+    prewarm: bool = False
+
+
 class APIConfig(BaseModel):
     """API configuration."""
 
@@ -233,6 +244,7 @@ class Config(BaseModel):
     llm: LLMConfig
     gateways: GatewaysConfig = Field(default_factory=GatewaysConfig)
     relay: RelayConfig = Field(default_factory=RelayConfig)
+    browser: BrowserConfig = Field(default_factory=BrowserConfig)
     api: APIConfig = Field(default_factory=APIConfig)
     transcription: TranscriptionConfig = Field(default_factory=TranscriptionConfig)
     tts: TTSConfig = Field(default_factory=TTSConfig)
@@ -245,13 +257,9 @@ class Config(BaseModel):
 def _expand_env_vars(value: Any) -> Any:
     """Recursively expand environment variables in config values."""
     if isinstance(value, str):
-        # Match ${VAR_NAME} pattern
-        pattern = r"\$\{([^}]+)\}"
-        matches = re.findall(pattern, value)
-        for match in matches:
-            env_value = os.environ.get(match, "")
-            value = value.replace(f"${{{match}}}", env_value)
-        return value
+        if "${" not in value:
+            return value
+        return _ENV_PATTERN.sub(lambda m: os.environ.get(m.group(1), ""), value)
     elif isinstance(value, dict):
         return {k: _expand_env_vars(v) for k, v in value.items()}
     elif isinstance(value, list):
@@ -259,6 +267,22 @@ def _expand_env_vars(value: Any) -> Any:
     return value
 
 
+# Parsed configs by (config path, env path), with the config and .env file mtimes and the
+# values of the ${VAR} references they were expanded with
+_config_cache: dict[
+    tuple[str, str | None],
+    tuple[int, int | None, tuple[tuple[str, str | None], ...], Config],
+] = {}
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Return the file's mtime in nanoseconds, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def load_config(
     config_path: str | Path = "config.yml",
     env_path: str | Path | None = ".env",
@@ -273,22 +297,46 @@ def load_config(
         Config object with loaded configuration
     """
     # Load environment variables from .env file
+    env_mtime_ns = None
     if env_path:
         env_file = Path(env_path)
-        if env_file.exists():
+        env_mtime_ns = _mtime_ns(env_file)
+        if env_mtime_ns is not None:
             load_dotenv(env_file)
 
     config_file = Path(config_path)
-    if not config_file.exists():
-        raise FileNotFoundError(f"Config file not found: {config_file}")
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_file}") from None
+
+    # Reuse the parsed config while the files and the referenced variables are unchanged
+    cache_key = (str(config_file.resolve()), str(env_path) if env_path else None)
+    cached = _config_cache.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] == mtime_ns
+        and cached[1] == env_mtime_ns
+        and all(os.environ.get(name) == value for name, value in cached[2])
+    ):
+        return cached[3]
 
     with open(config_file) as f:
-        raw_config = yaml.safe_load(f) or {}
+        text = f.read()
+    raw_config = yaml.load(text, Loader=_YamlLoader) or {}
+    env_refs = tuple((name, os.environ.get(name)) for name in set(_ENV_PATTERN.findall(text)))
 
     # Expand environment variables
     expanded_config = _expand_env_vars(raw_config)
 
-    return Config(**expanded_config)
+    config = Config(**expanded_config)
+    _config_cache[cache_key] = (mtime_ns, env_mtime_ns, env_refs, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Drop all configs cached by load_config."""
+    _config_cache.clear()
 
 
 def ensure_directories(config: Config) -> None:
@@ -297,16 +345,25 @@ def ensure_directories(config: Config) -> None:
     Args:
         config: Configuration object
     """
-    paths = [
-        config.paths.skills,
-        config.paths.memory,
-        config.paths.media,
-        config.paths.logs,
-        config.paths.db,
-    ]
-
-    for path in paths:
-        Path(path).mkdir(parents=True, exist_ok=True)
+    paths = {
+        Path(p).resolve()
+        for p in (
+            config.paths.skills,
+            config.paths.memory,
+            config.paths.media,
+            config.paths.logs,
+            config.paths.db,
+        )
+    }
+
+    # Deepest first: creating a path with parents=True also creates its ancestors,
+    # so any path that is an ancestor of one already created can be skipped
+    created: list[Path] = []
+    for path in sorted(paths, key=lambda p: len(p.parts), reverse=True):
+        if any(path in c.parents for c in created):
+            continue
+        path.mkdir(parents=True, exist_ok=True)
+        created.append(path)
 
 
 # Global config instance
@@ -321,7 +378,12 @@ def get_config() -> Config:
     return _config
 
 
-def set_config(config: Config) -> None:
-    """Set the global config instance."""
+def set_config(config: Config | None) -> None:
+    """Set the global config instance.
+
+    Passing None resets the global config and clears the load_config cache.
+    """
     global _config
     _config = config
+    if config is None:
+        clear_config_cache()
@@ -1,6 +1,7 @@
 """Directive parser for message processing."""
 
 import re
+from typing import Any
 
 from openbotx.models.enums import MessageDirective, PromptMode, ToolProfile
 from openbotx.models.message import ParsedDirectives
@@ -25,6 +26,27 @@ PROMPT_MODE_PATTERNS: dict[str, PromptMode] = {
 }
 
 
+def _directive_names(patterns: dict[str, Any]) -> dict[str, Any]:
+    """Map bare directive names (e.g. "think") to their values, keeping pattern order."""
+    return {pattern[1:-2]: value for pattern, value in patterns.items()}
+
+
+_DIRECTIVE_NAMES: dict[str, MessageDirective] = _directive_names(DIRECTIVE_PATTERNS)
+_TOOL_PROFILE_NAMES: dict[str, ToolProfile] = _directive_names(TOOL_PROFILE_PATTERNS)
+_PROMPT_MODE_NAMES: dict[str, PromptMode] = _directive_names(PROMPT_MODE_PATTERNS)
+
+# Single pass over the text for every known directive
+_ANY_DIRECTIVE_RE = re.compile(
+    r"/(" + "|".join([*_DIRECTIVE_NAMES, *_TOOL_PROFILE_NAMES, *_PROMPT_MODE_NAMES]) + r")\b",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+_DIRECTIVE_RES: dict[MessageDirective, re.Pattern[str]] = {
+    directive: re.compile(pattern, re.IGNORECASE)
+    for pattern, directive in DIRECTIVE_PATTERNS.items()
+}
+
+
 def parse_directives(text: str) -> ParsedDirectives:
     """Parse directives from message text.
 
@@ -46,34 +68,30 @@ def parse_directives(text: str) -> ParsedDirectives:
     if not text:
         return ParsedDirectives()
 
-    directives: list[MessageDirective] = []
-    prompt_mode = PromptMode.FULL
+    found: set[str] = set()
+
+    def _strip(match: re.Match[str]) -> str:
+        found.add(match.group(1).lower())
+        return ""
+
+    clean_text = _ANY_DIRECTIVE_RE.sub(_strip, text)
+
+    # Resolve in pattern order so precedence matches the pattern tables
+    directives = [d for name, d in _DIRECTIVE_NAMES.items() if name in found]
+    elevated = MessageDirective.ELEVATED in directives
+
     tool_profile = ToolProfile.FULL
-    elevated = False
-    clean_text = text
-
-    # Extract message directives
-    for pattern, directive in DIRECTIVE_PATTERNS.items():
-        if re.search(pattern, clean_text, re.IGNORECASE):
-            directives.append(directive)
-            clean_text = re.sub(pattern, "", clean_text, flags=re.IGNORECASE)
-            if directive == MessageDirective.ELEVATED:
-                elevated = True
-
-    # Extract tool profile directives
-    for pattern, profile in TOOL_PROFILE_PATTERNS.items():
-        if re.search(pattern, clean_text, re.IGNORECASE):
+    for name, profile in _TOOL_PROFILE_NAMES.items():
+        if name in found:
             tool_profile = profile
-            clean_text = re.sub(pattern, "", clean_text, flags=re.IGNORECASE)
 
-    # Extract prompt mode directives
-    for pattern, mode in PROMPT_MODE_PATTERNS.items():
-        if re.search(pattern, clean_text, re.IGNORECASE):
+    prompt_mode = PromptMode.FULL
+    for name, mode in _PROMPT_MODE_NAMES.items():
+        if name in found:
             prompt_mode = mode
-            clean_text = re.sub(pattern, "", clean_text, flags=re.IGNORECASE)
 
     # Clean up extra whitespace
-    clean_text = re.sub(r"\s+", " ", clean_text).strip()
+    clean_text = _WHITESPACE_RE.sub(" ", clean_text).strip()
 
     return ParsedDirectives(
         directives=directives,
@@ -94,10 +112,8 @@ def has_directive(text: str, directive: MessageDirective) -> bool:
     Returns:
         True if directive is present
     """
-    for pattern, dir_type in DIRECTIVE_PATTERNS.items():
-        if dir_type == directive and re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    pattern = _DIRECTIVE_RES.get(directive)
+    return pattern is not None and pattern.search(text) is not None
 
 
 def extract_directive_value(text: str, directive: str) -> str | None:
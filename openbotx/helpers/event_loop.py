@@ -0,0 +1,28 @@
+"""Event loop entry point for OpenBotX."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a new event loop.
+
+    Uses uvloop when it is installed (it ships with uvicorn[standard]), falling
+    back to the default asyncio loop otherwise.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
@@ -0,0 +1,37 @@
+"""JSON encoding helpers that use orjson when it is installed.
+
+orjson is an optional speedup (the "speedups" extra); without it these fall
+back to the stdlib json module with the same results. orjson's decode error
+subclasses json.JSONDecodeError, so callers only need to catch that.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _HAS_ORJSON = False
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON from a string or UTF-8 bytes."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
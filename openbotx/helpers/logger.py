@@ -132,6 +132,22 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def is_enabled_for(name: str | None, level: int) -> bool:
+    """Check whether a logger from get_logger(name) would emit at a level.
+
+    The structlog proxy has no isEnabledFor; the level lives on the stdlib
+    logger of the same name, which caches the answer until the level changes.
+
+    Args:
+        name: Logger name, as passed to get_logger
+        level: Standard logging level (e.g. logging.DEBUG)
+
+    Returns:
+        True if events at this level are emitted
+    """
+    return logging.getLogger(name).isEnabledFor(level)
+
+
 class LogContext:
     """Context manager for adding context to logs."""
 
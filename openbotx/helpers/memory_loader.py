@@ -1,11 +1,15 @@
 """Memory index initialization helper for OpenBotX."""
 
+from __future__ import annotations
+
 import os
+from typing import TYPE_CHECKING
 
-from openbotx.core.memory_index import MemoryIndex, set_memory_index
 from openbotx.helpers.config import Config
 from openbotx.helpers.logger import get_logger
-from openbotx.providers.embedding.local import LocalEmbeddingProvider
+
+if TYPE_CHECKING:
+    from openbotx.core.memory_index import MemoryIndex
 
 _logger = get_logger("memory_loader")
 
@@ -26,6 +30,9 @@ async def initialize_memory_index(config: Config) -> MemoryIndex | None:
     memory_paths = [p.strip() for p in memory_paths_raw.split(",") if p.strip()]
 
     try:
+        from openbotx.core.memory_index import MemoryIndex, set_memory_index
+        from openbotx.providers.embedding.local import LocalEmbeddingProvider
+
         embedding_provider = LocalEmbeddingProvider(
             config={
                 "model": os.getenv("OPENBOTX_EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
@@ -0,0 +1,61 @@
+"""Shared AsyncOpenAI clients for OpenBotX providers."""
+
+from typing import TYPE_CHECKING
+
+from openbotx.helpers.logger import get_logger
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+logger = get_logger("openai_client")
+
+# One client per API key, with the number of providers currently holding it
+_clients: dict[str, tuple["AsyncOpenAI", int]] = {}
+
+
+def acquire_openai_client(api_key: str) -> "AsyncOpenAI":
+    """Get the shared AsyncOpenAI client for an API key.
+
+    Providers using the same key share one client, and with it one HTTP
+    connection pool. Every call must be paired with release_openai_client.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    entry = _clients.get(api_key)
+    if entry is not None:
+        client, refs = entry
+        _clients[api_key] = (client, refs + 1)
+        return client
+
+    from openai import AsyncOpenAI
+
+    client = AsyncOpenAI(api_key=api_key)
+    _clients[api_key] = (client, 1)
+    logger.debug("openai_client_created")
+    return client
+
+
+async def release_openai_client(api_key: str) -> None:
+    """Release a client obtained from acquire_openai_client.
+
+    The client is closed once no provider holds it anymore.
+
+    Args:
+        api_key: OpenAI API key the client was acquired with
+    """
+    entry = _clients.get(api_key)
+    if entry is None:
+        return
+
+    client, refs = entry
+    if refs > 1:
+        _clients[api_key] = (client, refs - 1)
+        return
+
+    del _clients[api_key]
+    await client.close()
+    logger.debug("openai_client_closed")
@@ -0,0 +1,47 @@
+"""Default value factories shared by OpenBotX models."""
+
+import os
+import threading
+from datetime import UTC, datetime
+from functools import partial
+
+# Current UTC time; a partial keeps the call in C (no lambda frame, no global lookups)
+utc_now = partial(datetime.now, UTC)
+
+_ID_BYTES = 16
+_ID_POOL_SIZE = 4096
+
+
+class _IdPool(threading.local):
+    """Per-thread buffer of random bytes that ids are sliced from."""
+
+    def __init__(self) -> None:
+        self.buffer = b""
+        self.position = 0
+
+
+_id_pool = _IdPool()
+
+
+def _reset_id_pool() -> None:
+    """Drop the inherited buffer in forked children so ids are never reused."""
+    global _id_pool
+    _id_pool = _IdPool()
+
+
+os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def new_id() -> str:
+    """Return a random 128-bit id as 32 hex characters.
+
+    Draws from a per-thread 4 KiB os.urandom buffer instead of one syscall and a
+    UUID object per id.
+    """
+    pool = _id_pool
+    position = pool.position
+    if position + _ID_BYTES > len(pool.buffer):
+        pool.buffer = os.urandom(_ID_POOL_SIZE)
+        position = 0
+    pool.position = position + _ID_BYTES
+    return pool.buffer[position : position + _ID_BYTES].hex()
@@ -13,6 +13,10 @@ class MessageType(str, Enum):
     FILE = "file"
 
 
+# Value -> member lookup for hot paths, avoiding the Enum.__call__ machinery
+MESSAGE_TYPE_BY_VALUE: dict[str, MessageType] = {m.value: m for m in MessageType}
+
+
 class ResponseContentType(str, Enum):
     """Type of response content from agent."""
 
@@ -1,10 +1,13 @@
 """Memory models for OpenBotX vector memory system."""
 
-from datetime import UTC, datetime
+import struct
+from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from openbotx.models.defaults import utc_now
 
 
 class MemorySource(str, Enum):
@@ -15,6 +18,10 @@ class MemorySource(str, Enum):
     EXTRA = "extra"
 
 
+# Value -> member lookup for hydrating rows, avoiding the Enum.__call__ machinery
+MEMORY_SOURCE_BY_VALUE: dict[str, MemorySource] = {m.value: m for m in MemorySource}
+
+
 class Chunk(BaseModel):
     """A chunk of text for embedding and search."""
 
@@ -25,14 +32,29 @@ class Chunk(BaseModel):
     end_line: int
     text: str
     hash: str
-    embedding: list[float] | None = None
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    embedding: bytes | None = None  # packed float32 vector
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def _pack_embedding(cls, v: Any) -> Any:
+        # accept a list of floats for backward compatibility
+        if isinstance(v, list | tuple):
+            return struct.pack(f"{len(v)}f", *v)
+        return v
 
     @property
     def line_count(self) -> int:
         """Number of lines in this chunk."""
         return self.end_line - self.start_line + 1
 
+    @property
+    def embedding_values(self) -> list[float] | None:
+        """Embedding unpacked into a list of floats."""
+        if self.embedding is None:
+            return None
+        return list(struct.unpack(f"{len(self.embedding) // 4}f", self.embedding))
+
 
 class MemoryFile(BaseModel):
     """A file tracked in the memory index."""
@@ -42,7 +64,7 @@ class MemoryFile(BaseModel):
     mtime: float
     size: int
     source: MemorySource
-    indexed_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    indexed_at: datetime = Field(default_factory=utc_now)
     chunk_count: int = 0
 
 
@@ -70,8 +92,8 @@ class MemoryIndexMeta(BaseModel):
     embedding_dimensions: int = 0
     chunk_size: int = 500
     chunk_overlap: int = 50
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     file_count: int = 0
     chunk_count: int = 0
 
@@ -1,11 +1,11 @@
 """Message models for OpenBotX."""
 
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import Any
-from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
+from openbotx.models.defaults import new_id, utc_now
 from openbotx.models.enums import (
     GatewayType,
     MessageDirective,
@@ -16,6 +16,38 @@ from openbotx.models.enums import (
     ToolProfile,
 )
 
+_MEDIA_KINDS = frozenset({"audio", "image", "video"})
+
+
+def _media_kind(content_type: str) -> str:
+    """Get the media kind ("audio", "image", "video" or "other") of a MIME type."""
+    kind, sep, _ = content_type.partition("/")
+    return kind if sep and kind in _MEDIA_KINDS else "other"
+
+
+# MIME top-level type -> message type for inbound attachments
+_MESSAGE_TYPE_BY_MIME_TYPE = {
+    "image": MessageType.IMAGE,
+    "video": MessageType.VIDEO,
+    "audio": MessageType.AUDIO,
+}
+
+
+def message_type_for_content_type(content_type: str) -> MessageType:
+    """Get the inbound message type for an attachment MIME type.
+
+    Args:
+        content_type: MIME content type
+
+    Returns:
+        IMAGE, VIDEO or AUDIO for those media types, FILE otherwise
+    """
+    slash = content_type.find("/")
+    if slash < 0:
+        return MessageType.FILE
+    # lowercase only the short top-level type, not the whole (possibly long) MIME string
+    return _MESSAGE_TYPE_BY_MIME_TYPE.get(content_type[:slash].lower(), MessageType.FILE)
+
 
 class ParsedDirectives(BaseModel):
     """Parsed directives from message text."""
@@ -45,7 +77,7 @@ class ParsedDirectives(BaseModel):
 class Attachment(BaseModel):
     """Attachment model for messages."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=new_id)
     filename: str
     content_type: str
     size: int
@@ -54,26 +86,40 @@ class Attachment(BaseModel):
     data: bytes | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    _kind: str = PrivateAttr(default="other")
+
+    @model_validator(mode="after")
+    def _set_kind(self) -> "Attachment":
+        self._kind = _media_kind(self.content_type)
+        return self
+
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "Attachment":
+        """Build an attachment from already-typed internal values, skipping validation."""
+        attachment = cls.model_construct(**fields)
+        attachment._kind = _media_kind(attachment.content_type)
+        return attachment
+
     @property
     def is_audio(self) -> bool:
         """Check if attachment is audio."""
-        return self.content_type.startswith("audio/")
+        return self._kind == "audio"
 
     @property
     def is_image(self) -> bool:
         """Check if attachment is image."""
-        return self.content_type.startswith("image/")
+        return self._kind == "image"
 
     @property
     def is_video(self) -> bool:
         """Check if attachment is video."""
-        return self.content_type.startswith("video/")
+        return self._kind == "video"
 
 
 class InboundMessage(BaseModel):
     """Inbound message from a gateway."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=new_id)
     channel_id: str
     user_id: str | None = None
     gateway: GatewayType
@@ -82,11 +128,20 @@ class InboundMessage(BaseModel):
     attachments: list[Attachment] = Field(default_factory=list)
     status: MessageStatus = MessageStatus.PENDING
     metadata: dict[str, Any] = Field(default_factory=dict)
-    correlation_id: str = Field(default_factory=lambda: str(uuid4()))
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    correlation_id: str = Field(default_factory=new_id)
+    timestamp: datetime = Field(default_factory=utc_now)
     reply_to: str | None = None
     directives: ParsedDirectives | None = None
 
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "InboundMessage":
+        """Build a message from already-typed internal values, skipping validation.
+
+        Use only where every field is produced by our own code with the right type;
+        raw gateway/API payloads must go through normal validation.
+        """
+        return cls.model_construct(**fields)
+
     @property
     def has_attachments(self) -> bool:
         """Check if message has attachments."""
@@ -98,28 +153,31 @@ class InboundMessage(BaseModel):
         return any(a.is_audio for a in self.attachments)
 
     def get_content(self) -> str:
-        """Get message content (text or transcription)."""
-        if self.directives and self.directives.clean_text:
-            return self.directives.clean_text
-        return self.text or ""
+        """Get message content (text or transcription).
+
+        Not cached: the orchestrator sets directives and attachment processing
+        rewrites text after the message is built.
+        """
+        directives = self.directives
+        if directives is None:
+            return self.text or ""
+        return directives.clean_text or self.text or ""
 
     def get_prompt_mode(self) -> PromptMode:
         """Get the prompt mode from directives."""
-        if self.directives:
-            return self.directives.prompt_mode
-        return PromptMode.FULL
+        directives = self.directives
+        return PromptMode.FULL if directives is None else directives.prompt_mode
 
     def get_tool_profile(self) -> ToolProfile:
         """Get the tool profile from directives."""
-        if self.directives:
-            return self.directives.tool_profile
-        return ToolProfile.FULL
+        directives = self.directives
+        return ToolProfile.FULL if directives is None else directives.tool_profile
 
 
 class OutboundMessage(BaseModel):
     """Outbound message to send via gateway."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=new_id)
     channel_id: str
     reply_to: str | None = None
     gateway: GatewayType
@@ -128,7 +186,18 @@ class OutboundMessage(BaseModel):
     attachments: list[Attachment] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
     correlation_id: str | None = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
+
+    _timestamp_iso: tuple[datetime, str] | None = PrivateAttr(default=None)
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Timestamp in ISO 8601 format, formatted once per timestamp value."""
+        cached = self._timestamp_iso
+        if cached is None or cached[0] is not self.timestamp:
+            cached = (self.timestamp, self.timestamp.isoformat())
+            self._timestamp_iso = cached
+        return cached[1]
 
 
 class MessageContext(BaseModel):
@@ -134,7 +134,7 @@ class AgentResponse(BaseModel):
     def to_outbound_message(
         self,
         channel_id: str,
-        gateway_capabilities: set[ResponseCapability],
+        gateway_capabilities: frozenset[ResponseCapability],
         gateway_type: GatewayType,
         reply_to: str | None = None,
         correlation_id: str | None = None,
@@ -36,7 +36,8 @@ class ProviderBase(ABC):
         self.name = name
         self.config = config or {}
         self._status = ProviderStatus.INITIALIZED
-        self._logger = get_logger(f"provider.{self.provider_type.value}.{name}")
+        self._logger_name = f"provider.{self.provider_type.value}.{name}"
+        self._logger = get_logger(self._logger_name)
 
     @property
     def status(self) -> ProviderStatus:
@@ -16,12 +16,13 @@ class LocalEmbeddingProvider(EmbeddingProvider):
 
         Args:
             name: Provider name
-            config: Configuration with optional model name
+            config: Configuration with optional model name and batch_size
         """
         super().__init__(name, config)
         config = config or {}
 
         self._model_name = config.get("model", "all-MiniLM-L6-v2")
+        self._batch_size = int(config.get("batch_size", 32))
         self._model = None
         self._dims = 0
 
@@ -68,7 +69,7 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         if not self._model:
             raise RuntimeError("Provider not initialized")
 
-        embedding = self._model.encode(text, convert_to_numpy=True)
+        embedding = self._model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
         return embedding.tolist()
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
@@ -86,8 +87,16 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         if not texts:
             return []
 
-        embeddings = self._model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
-        return [e.tolist() for e in embeddings]
+        embeddings = self._model.encode(
+            texts,
+            batch_size=self._batch_size,
+            convert_to_numpy=True,
+            convert_to_tensor=False,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        # one tolist() on the 2-D array converts every row in a single C call
+        return embeddings.tolist()
 
     async def stop(self) -> None:
         """Stop the provider."""
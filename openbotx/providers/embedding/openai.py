@@ -1,12 +1,27 @@
 """OpenAI embedding provider for OpenBotX."""
 
+import asyncio
 import os
 from typing import Any
 
 from openai import AsyncOpenAI
 
+from openbotx.helpers.openai_client import acquire_openai_client, release_openai_client
+from openbotx.helpers.tokens import truncate_to_token_limit
 from openbotx.providers.embedding.base import EmbeddingProvider
 
+# Input limit of the OpenAI embedding models, in tokens
+_MAX_INPUT_TOKENS = 8191
+
+
+def _fits_without_tokenizing(text: str) -> bool:
+    """Check if text is certainly under the token limit without encoding it.
+
+    Every token covers at least one UTF-8 byte, so the byte length bounds the token count.
+    """
+    length = len(text)
+    return length * 4 <= _MAX_INPUT_TOKENS or (length <= _MAX_INPUT_TOKENS and text.isascii())
+
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """OpenAI embeddings using text-embedding-3-small."""
@@ -18,7 +33,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
 
         Args:
             name: Provider name
-            config: Configuration with optional api_key, model, dimensions
+            config: Configuration with optional api_key, model, dimensions, max_concurrency
         """
         super().__init__(name, config)
         config = config or {}
@@ -26,7 +41,10 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         self._api_key = config.get("api_key") or os.getenv("OPENAI_API_KEY")
         self._model = config.get("model", "text-embedding-3-small")
         self._dimensions_config = config.get("dimensions", 1536)
+        self._max_concurrency = int(config.get("max_concurrency", 8))
         self._client: AsyncOpenAI | None = None
+        # key the shared client was acquired with, released with the same key on stop
+        self._client_key: str | None = None
 
     @property
     def dimensions(self) -> int:
@@ -43,10 +61,15 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         if not self._api_key:
             raise ValueError("OpenAI API key not configured")
 
-        self._client = AsyncOpenAI(api_key=self._api_key)
+        self._client_key = self._api_key
+        self._client = acquire_openai_client(self._client_key)
         await super().initialize()
         self._logger.info("openai_embedding_initialized", model=self._model)
 
+    def _truncate(self, text: str) -> str:
+        """Truncate text to the model's input token limit."""
+        return truncate_to_token_limit(text, _MAX_INPUT_TOKENS, model=self._model, suffix="")
+
     async def embed(self, text: str) -> list[float]:
         """Embed a single text.
 
@@ -60,7 +83,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             raise RuntimeError("Provider not initialized")
 
         # truncate if too long
-        text = text[:8000] if len(text) > 8000 else text
+        if not _fits_without_tokenizing(text):
+            text = self._truncate(text)
 
         response = await self._client.embeddings.create(
             model=self._model,
@@ -79,37 +103,46 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         Returns:
             List of embedding vectors
         """
-        if not self._client:
+        client = self._client
+        if not client:
             raise RuntimeError("Provider not initialized")
 
         if not texts:
             return []
 
-        # truncate each text if too long
-        texts = [t[:8000] if len(t) > 8000 else t for t in texts]
+        # truncate each text if too long, tokenizing off the event loop only when needed
+        if not all(_fits_without_tokenizing(t) for t in texts):
+            raw_texts = texts
+            texts = await asyncio.to_thread(
+                lambda: [t if _fits_without_tokenizing(t) else self._truncate(t) for t in raw_texts]
+            )
 
-        # openai supports batching up to certain limit
+        # openai supports batching up to certain limit; send batches concurrently
         batch_size = 100
-        all_embeddings = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+        semaphore = asyncio.Semaphore(self._max_concurrency)
 
-            response = await self._client.embeddings.create(
-                model=self._model,
-                input=batch,
-                dimensions=self._dimensions_config,
-            )
+        async def embed_one_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                response = await client.embeddings.create(
+                    model=self._model,
+                    input=batch,
+                    dimensions=self._dimensions_config,
+                )
 
             # sort by index to maintain order
             sorted_data = sorted(response.data, key=lambda x: x.index)
-            all_embeddings.extend([d.embedding for d in sorted_data])
+            return [d.embedding for d in sorted_data]
+
+        batch_results = await asyncio.gather(
+            *(embed_one_batch(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size))
+        )
 
-        return all_embeddings
+        return [embedding for batch in batch_results for embedding in batch]
 
     async def stop(self) -> None:
         """Stop the provider."""
-        if self._client:
-            await self._client.close()
+        if self._client_key is not None:
             self._client = None
+            client_key, self._client_key = self._client_key, None
+            await release_openai_client(client_key)
         await super().stop()
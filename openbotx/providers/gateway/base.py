@@ -1,10 +1,13 @@
 """Base gateway provider for OpenBotX."""
 
 import asyncio
+import logging
+import os
 from abc import abstractmethod
 from collections.abc import Callable
 from typing import Any
 
+from openbotx.helpers.logger import is_enabled_for
 from openbotx.models.enums import GatewayType, ProviderType, ResponseCapability
 from openbotx.models.message import InboundMessage, OutboundMessage
 from openbotx.providers.base import ProviderBase, ProviderHealth
@@ -13,6 +16,11 @@ from openbotx.providers.base import ProviderBase, ProviderHealth
 MessageHandler = Callable[[InboundMessage], None]
 
 
+def get_io_pool_size() -> int:
+    """Worker count for gateway executors doing blocking file and decode work."""
+    return max(1, int(os.getenv("OPENBOTX_IO_POOL", "4")))
+
+
 class GatewayProvider(ProviderBase):
     """Base class for gateway providers.
 
@@ -23,6 +31,9 @@ class GatewayProvider(ProviderBase):
     provider_type = ProviderType.GATEWAY
     gateway_type: GatewayType
 
+    # Response types the gateway can deliver; shared by all instances
+    RESPONSE_CAPS: frozenset[ResponseCapability] = frozenset({ResponseCapability.TEXT})
+
     def __init__(
         self,
         name: str,
@@ -36,20 +47,47 @@ class GatewayProvider(ProviderBase):
         """
         super().__init__(name, config)
         self._message_handler: MessageHandler | None = None
-        self._response_capabilities: set[ResponseCapability] = {ResponseCapability.TEXT}
+        self._caps_values = tuple(c.value for c in self.RESPONSE_CAPS)
         self._stop_event = asyncio.Event()
+        self._run_task: asyncio.Task[None] | None = None
         self._running = False
+        self._channel_prefix = f"{self.gateway_type.value}-"
 
         # Generic authorization
-        self.allowed_users: list[str] = []
-        if config:
-            allowed = config.get("allowed_users", [])
-            self.allowed_users = [str(u) for u in allowed] if allowed else []
+        self.allowed_users = config.get("allowed_users", []) if config else []
 
     @property
-    def response_capabilities(self) -> set[ResponseCapability]:
+    def response_capabilities(self) -> frozenset[ResponseCapability]:
         """Get response capabilities supported by this gateway."""
-        return self._response_capabilities
+        return self.RESPONSE_CAPS
+
+    @property
+    def allowed_users(self) -> list[str]:
+        """User ids allowed to use this gateway (empty = everyone)."""
+        return self._allowed_users_list
+
+    @allowed_users.setter
+    def allowed_users(self, users: list[str | int] | None) -> None:
+        self._allowed_users_list = [str(u) for u in users] if users else []
+        # None means "allow all"; ints are kept separately so int ids skip str()
+        self._allowed_users = frozenset(self._allowed_users_list) or None
+        self._allowed_user_ints = frozenset(
+            int(u) for u in self._allowed_users_list if u.lstrip("-").isdigit() and str(int(u)) == u
+        )
+
+    @property
+    def run_task(self) -> asyncio.Task[None] | None:
+        """Task running _run(), cancelled by request_stop() on shutdown."""
+        return self._run_task
+
+    @run_task.setter
+    def run_task(self, task: asyncio.Task[None] | None) -> None:
+        self._run_task = task
+
+    @property
+    def _warn_enabled(self) -> bool:
+        """Whether warnings from this gateway are emitted, following the current log level."""
+        return is_enabled_for(self._logger_name, logging.WARNING)
 
     @property
     def is_running(self) -> bool:
@@ -65,7 +103,7 @@ class GatewayProvider(ProviderBase):
         Returns:
             True if supported
         """
-        return response_type in self._response_capabilities
+        return response_type in self.RESPONSE_CAPS
 
     def build_channel_id(self, identifier: str) -> str:
         """Build channel ID with gateway prefix.
@@ -76,8 +114,7 @@ class GatewayProvider(ProviderBase):
         Returns:
             Prefixed channel ID
         """
-        gateway_prefix = self.gateway_type.value
-        return f"{gateway_prefix}-{identifier}"
+        return self._channel_prefix + identifier
 
     def is_user_allowed(self, user_id: str | int) -> bool:
         """Check if user is allowed to use this gateway.
@@ -88,9 +125,11 @@ class GatewayProvider(ProviderBase):
         Returns:
             True if allowed (empty allowlist = everyone allowed)
         """
-        if not self.allowed_users:
+        if self._allowed_users is None:
             return True
-        return str(user_id) in self.allowed_users
+        if isinstance(user_id, int):
+            return user_id in self._allowed_user_ints
+        return user_id in self._allowed_users
 
     def set_message_handler(self, handler: MessageHandler) -> None:
         """Set the message handler callback.
@@ -110,19 +149,20 @@ class GatewayProvider(ProviderBase):
         """
         if self._message_handler:
             self._message_handler(message)
-        else:
+        elif self._warn_enabled:
             self._logger.warning("no_message_handler", message_id=message.id)
 
     async def _run(self) -> None:
         """Main run loop for the gateway.
 
         Override this method to implement continuous async operation.
-        The loop should check self._stop_event periodically to allow graceful shutdown.
+        Block on the actual source of work instead of polling; request_stop()
+        cancels the run task, so a pending await is interrupted on shutdown.
 
         Example:
             while not self._stop_event.is_set():
-                await self._process_next()
-                await asyncio.sleep(0.1)
+                item = await self._queue.get()
+                await self._process(item)
         """
         # default implementation waits for stop
         await self._stop_event.wait()
@@ -130,10 +170,22 @@ class GatewayProvider(ProviderBase):
     def request_stop(self) -> None:
         """Request the gateway to stop.
 
-        Sets the stop event which should cause _run() to exit.
+        Sets the stop event and cancels the run task started by GatewayManager,
+        which makes _run() exit even while it is waiting for work.
         """
         self._stop_event.set()
 
+        task = self._run_task
+        if task is None or task.done():
+            return
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            current = None
+        # when called from inside _run(), the loop exits on its own
+        if task is not current:
+            task.cancel()
+
     @abstractmethod
     async def send(self, message: OutboundMessage) -> bool:
         """Send an outbound message.
@@ -158,7 +210,7 @@ class GatewayProvider(ProviderBase):
             message="Gateway is running" if self._running else "Gateway is stopped",
             details={
                 "gateway_type": self.gateway_type.value,
-                "capabilities": [c.value for c in self._response_capabilities],
+                "capabilities": self._caps_values,
                 "running": self._running,
             },
         )
@@ -4,6 +4,8 @@ import asyncio
 import mimetypes
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -13,17 +15,46 @@ from openbotx.models.enums import (
     ProviderStatus,
     ResponseCapability,
 )
-from openbotx.models.message import Attachment, InboundMessage, OutboundMessage
-from openbotx.providers.gateway.base import GatewayProvider
+from openbotx.models.message import (
+    Attachment,
+    InboundMessage,
+    OutboundMessage,
+    message_type_for_content_type,
+)
+from openbotx.providers.gateway.base import GatewayProvider, get_io_pool_size
+
+# Inputs that end the session, compared case-insensitively
+_EXIT_COMMANDS = frozenset({"quit", "exit", "bye"})
+_EXIT_COMMAND_MAX_LEN = max(len(c) for c in _EXIT_COMMANDS)
+_FILE_COMMAND = "/file "
+
+# Written in one call when the CLI starts
+_BANNER = "\n".join(
+    [
+        "",
+        "=" * 50,
+        "OpenBotX CLI Interface",
+        "=" * 50,
+        "Type your message and press Enter.",
+        "Commands:",
+        "  /file <path> [message] - Send a file with optional message",
+        "  quit, exit - Stop the CLI",
+        "=" * 50,
+        "",
+        "",
+    ]
+)
 
 
 class CLIGateway(GatewayProvider):
     """CLI gateway for interactive terminal mode.
 
-    Runs a non-blocking input loop that checks _stop_event for graceful shutdown.
+    A single daemon thread reads stdin and hands lines to the event loop through
+    a queue; the run loop waits on that queue and on _stop_event, without polling.
     """
 
     gateway_type = GatewayType.CLI
+    RESPONSE_CAPS = frozenset({ResponseCapability.TEXT})
 
     def __init__(
         self,
@@ -37,10 +68,15 @@ class CLIGateway(GatewayProvider):
             config: Provider configuration
         """
         super().__init__(name, config)
-        self._response_capabilities = {ResponseCapability.TEXT}
         self._channel_id = self.build_channel_id("session")
         self._pending_responses: dict[str, asyncio.Future[OutboundMessage]] = {}
-        self._input_poll_interval = 0.1
+        # lines from the reader thread; None marks end of input
+        self._input_queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._line_requested = threading.Event()
+        self._reader_thread: threading.Thread | None = None
+        self._io_executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._is_tty = False
 
     async def initialize(self) -> None:
         """Initialize the CLI gateway."""
@@ -51,6 +87,11 @@ class CLIGateway(GatewayProvider):
         self._set_status(ProviderStatus.STARTING)
         self._running = True
         self._stop_event.clear()
+        self._loop = asyncio.get_running_loop()
+        self._is_tty = sys.stdin.isatty()
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=get_io_pool_size(), thread_name_prefix="cli-io"
+        )
         self._set_status(ProviderStatus.RUNNING)
         self._logger.info("cli_gateway_started")
 
@@ -59,6 +100,9 @@ class CLIGateway(GatewayProvider):
         self._set_status(ProviderStatus.STOPPING)
         self._running = False
         self._stop_event.set()
+        if self._io_executor:
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+            self._io_executor = None
         self._set_status(ProviderStatus.STOPPED)
         self._logger.info("cli_gateway_stopped")
 
@@ -71,31 +115,36 @@ class CLIGateway(GatewayProvider):
 
         while not self._stop_event.is_set():
             try:
-                # non-blocking input with timeout
+                # wait for the next line from the reader thread, or for stop
                 user_input = await self._read_input_async()
 
                 if user_input is None:
-                    # timeout, check stop event and continue
-                    continue
+                    # stop requested
+                    break
 
                 if not user_input:
                     continue
 
                 # check for exit commands
-                if user_input.lower() in ("quit", "exit", "bye"):
+                if (
+                    len(user_input) <= _EXIT_COMMAND_MAX_LEN
+                    and user_input.lower() in _EXIT_COMMANDS
+                ):
                     print("\nGoodbye!\n")
                     self.request_stop()
                     break
 
                 # check for file command
-                if user_input.startswith("/file "):
-                    message = await self._process_file_command(user_input[6:].strip())
+                if user_input.startswith(_FILE_COMMAND):
+                    message = await self._process_file_command(
+                        user_input[len(_FILE_COMMAND) :].lstrip()
+                    )
                     if message:
                         await self._handle_message(message)
                     continue
 
                 # create text message
-                message = InboundMessage(
+                message = InboundMessage.from_trusted(
                     channel_id=self._channel_id,
                     user_id="cli-user",
                     gateway=self.gateway_type,
@@ -117,44 +166,70 @@ class CLIGateway(GatewayProvider):
                 print(f"\nError: {e}\n")
 
     async def _read_input_async(self) -> str | None:
-        """Read input asynchronously with timeout.
+        """Read the next input line, waiting until one arrives or stop is requested.
 
         Returns:
-            User input string or None if timeout
+            User input string, or None if stop was requested
+
+        Raises:
+            EOFError: If stdin was closed
         """
-        loop = asyncio.get_event_loop()
+        if self._reader_thread is None:
+            self._reader_thread = threading.Thread(
+                target=self._stdin_reader,
+                args=(self._loop or asyncio.get_running_loop(), self._is_tty),
+                name="cli-stdin-reader",
+                daemon=True,
+            )
+            self._reader_thread.start()
+
+        # the reader prompts only when a line is wanted, so "You: " is printed once
+        self._line_requested.set()
 
+        get_line = asyncio.ensure_future(self._input_queue.get())
+        stop_wait = asyncio.ensure_future(self._stop_event.wait())
         try:
-            # check if stdin has data (for piped input)
-            if not sys.stdin.isatty():
-                line = sys.stdin.readline()
-                if not line:
-                    return None
-                return line.strip()
-
-            # for interactive input, use executor with timeout
-            try:
-                result = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: input("You: ")),
-                    timeout=self._input_poll_interval,
-                )
-                return result
-            except TimeoutError:
-                return None
+            await asyncio.wait({get_line, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_wait.cancel()
+            if not get_line.done():
+                get_line.cancel()
 
-        except Exception:
+        if not get_line.done() or get_line.cancelled():
             return None
 
+        line = get_line.result()
+        if line is None:
+            raise EOFError
+        return line.strip()
+
+    def _stdin_reader(self, loop: asyncio.AbstractEventLoop, is_tty: bool) -> None:
+        """Read stdin lines on a dedicated thread and queue them for the event loop.
+
+        Args:
+            loop: Event loop running the gateway
+            is_tty: Whether stdin is an interactive terminal
+        """
+        while True:
+            self._line_requested.wait()
+            self._line_requested.clear()
+            try:
+                line: str | None = input("You: ") if is_tty else sys.stdin.readline() or None
+            except (EOFError, OSError, ValueError):
+                line = None
+
+            try:
+                loop.call_soon_threadsafe(self._input_queue.put_nowait, line)
+            except RuntimeError:
+                # event loop closed
+                return
+            if line is None:
+                return
+
     def _print_banner(self) -> None:
         """Print the CLI banner."""
-        print("\n" + "=" * 50)
-        print("OpenBotX CLI Interface")
-        print("=" * 50)
-        print("Type your message and press Enter.")
-        print("Commands:")
-        print("  /file <path> [message] - Send a file with optional message")
-        print("  quit, exit - Stop the CLI")
-        print("=" * 50 + "\n")
+        sys.stdout.write(_BANNER)
+        sys.stdout.flush()
 
     async def send(self, message: OutboundMessage) -> bool:
         """Send a message to the CLI.
@@ -166,12 +241,14 @@ class CLIGateway(GatewayProvider):
             True if sent successfully
         """
         try:
-            print(f"\n🤖 Assistant: {message.text}\n")
+            # one write and one flush per reply
+            sys.stdout.write(f"\n🤖 Assistant: {message.text}\n\n")
+            sys.stdout.flush()
 
             # resolve pending response if any
-            if message.reply_to and message.reply_to in self._pending_responses:
-                future = self._pending_responses.pop(message.reply_to)
-                if not future.done():
+            if message.reply_to:
+                future = self._pending_responses.pop(message.reply_to, None)
+                if future is not None and not future.done():
                     future.set_result(message)
 
             return True
@@ -222,15 +299,18 @@ class CLIGateway(GatewayProvider):
             return None
 
         try:
-            data = file_path.read_bytes()
+            # file reads block, so keep them off the event loop
+            data = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor, file_path.read_bytes
+            )
             filename = file_path.name
 
-            content_type, _ = mimetypes.guess_type(str(file_path))
+            content_type, _ = mimetypes.guess_type(file_path)
             content_type = content_type or "application/octet-stream"
 
-            message_type = self._detect_message_type_from_content_type(content_type)
+            message_type = message_type_for_content_type(content_type)
 
-            attachment = Attachment(
+            attachment = Attachment.from_trusted(
                 filename=filename,
                 content_type=content_type,
                 size=len(data),
@@ -240,7 +320,7 @@ class CLIGateway(GatewayProvider):
 
             print(f"Sending file: {filename} ({content_type}, {len(data)} bytes)")
 
-            return InboundMessage(
+            return InboundMessage.from_trusted(
                 channel_id=self._channel_id,
                 user_id="cli-user",
                 gateway=self.gateway_type,
@@ -253,26 +333,6 @@ class CLIGateway(GatewayProvider):
             print(f"Error reading file: {e}")
             return None
 
-    def _detect_message_type_from_content_type(self, content_type: str) -> MessageType:
-        """Detect message type from content type.
-
-        Args:
-            content_type: MIME content type
-
-        Returns:
-            Appropriate MessageType
-        """
-        ct = content_type.lower()
-
-        if ct.startswith("image/"):
-            return MessageType.IMAGE
-        elif ct.startswith("video/"):
-            return MessageType.VIDEO
-        elif ct.startswith("audio/"):
-            return MessageType.AUDIO
-        else:
-            return MessageType.FILE
-
     async def send_and_wait(
         self,
         text: str,
@@ -289,7 +349,7 @@ class CLIGateway(GatewayProvider):
         Returns:
             Response message or None
         """
-        message = InboundMessage(
+        message = InboundMessage.from_trusted(
             channel_id=self._channel_id,
             user_id="cli-user",
             gateway=self.gateway_type,
@@ -297,13 +357,14 @@ class CLIGateway(GatewayProvider):
             text=text,
         )
 
-        future: asyncio.Future[OutboundMessage] = asyncio.Future()
+        future: asyncio.Future[OutboundMessage] = asyncio.get_running_loop().create_future()
         self._pending_responses[message.id] = future
 
-        await self._handle_message(message)
-
         try:
+            await self._handle_message(message)
             return await asyncio.wait_for(future, timeout=timeout)
         except TimeoutError:
-            self._pending_responses.pop(message.id, None)
             return None
+        finally:
+            # no-op when send() already resolved it; covers timeout and cancellation
+            self._pending_responses.pop(message.id, None)
@@ -19,6 +19,13 @@ class TelegramGateway(GatewayProvider):
     """Telegram bot gateway."""
 
     gateway_type = GatewayType.TELEGRAM
+    RESPONSE_CAPS = frozenset(
+        {
+            ResponseCapability.TEXT,
+            ResponseCapability.AUDIO,
+            ResponseCapability.IMAGE,
+        }
+    )
 
     def __init__(
         self,
@@ -32,14 +39,7 @@ class TelegramGateway(GatewayProvider):
             config: Provider configuration with token
         """
         super().__init__(name, config)
-        self._response_capabilities = {
-            ResponseCapability.TEXT,
-            ResponseCapability.AUDIO,
-            ResponseCapability.IMAGE,
-        }
-
         self.token = config.get("token", "") if config else ""
-        self.allowed_users = config.get("allowed_users", []) if config else []
 
         self._application: Any = None
         self._running = False
@@ -146,7 +146,7 @@ class TelegramGateway(GatewayProvider):
 
         text = update.message.text
 
-        message = InboundMessage(
+        message = InboundMessage.from_trusted(
             channel_id=f"telegram-{chat_id}",
             user_id=str(user_id),
             gateway=self.gateway_type,
@@ -194,7 +194,7 @@ class TelegramGateway(GatewayProvider):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"audio-{timestamp}.ogg"
 
-            attachment = Attachment(
+            attachment = Attachment.from_trusted(
                 filename=filename,
                 content_type="audio/ogg",
                 size=len(file_bytes),
@@ -205,7 +205,7 @@ class TelegramGateway(GatewayProvider):
                 },
             )
 
-            message = InboundMessage(
+            message = InboundMessage.from_trusted(
                 channel_id=self.build_channel_id(str(chat_id)),
                 user_id=str(user_id),
                 gateway=self.gateway_type,
@@ -257,7 +257,7 @@ class TelegramGateway(GatewayProvider):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"photo-{timestamp}.jpg"
 
-            attachment = Attachment(
+            attachment = Attachment.from_trusted(
                 filename=filename,
                 content_type="image/jpeg",
                 size=len(file_bytes),
@@ -272,7 +272,7 @@ class TelegramGateway(GatewayProvider):
             # Get caption if any
             text = update.message.caption
 
-            message = InboundMessage(
+            message = InboundMessage.from_trusted(
                 channel_id=self.build_channel_id(str(chat_id)),
                 user_id=str(user_id),
                 gateway=self.gateway_type,
@@ -4,20 +4,90 @@ import asyncio
 import base64
 import json
 import mimetypes
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
-from uuid import uuid4
 
 import websockets
 from websockets.server import WebSocketServerProtocol
 
+from openbotx.helpers.fast_json import json_dumps, json_loads
+from openbotx.models.defaults import new_id
 from openbotx.models.enums import (
+    MESSAGE_TYPE_BY_VALUE,
     GatewayType,
     MessageType,
     ProviderStatus,
     ResponseCapability,
 )
-from openbotx.models.message import Attachment, InboundMessage, OutboundMessage
-from openbotx.providers.gateway.base import GatewayProvider
+from openbotx.models.message import (
+    Attachment,
+    InboundMessage,
+    OutboundMessage,
+    message_type_for_content_type,
+)
+from openbotx.providers.gateway.base import GatewayProvider, get_io_pool_size
+
+try:
+    import pybase64
+
+    _HAS_PYBASE64 = True
+except ImportError:  # optional speedup; stdlib base64 is the fallback
+    _HAS_PYBASE64 = False
+
+# Below this size the SIMD decoder's call overhead outweighs its speed
+_FAST_B64_MIN_LEN = 4096
+
+# Base64 payloads at least this long are decoded off the event loop
+_OFFLOAD_B64_MIN_LEN = 64 * 1024
+
+
+def _b64decode(data: str) -> bytes:
+    """Decode base64 text, with pybase64 for large payloads when available."""
+    if _HAS_PYBASE64 and len(data) >= _FAST_B64_MIN_LEN:
+        decoded: bytes = pybase64.b64decode(data.encode("ascii"))
+        return decoded
+    return base64.b64decode(data)
+
+
+# Welcome frame; client and channel ids are hex/ASCII, so they need no JSON escaping
+_WELCOME_TEMPLATE = '{"type":"connected","client_id":"%s","channel_id":"%s"}'
+
+# Text that can only be a JSON object or array; anything else is plain text
+_JSON_START = re.compile(r"\s*[{\[]")
+_JSON_START_BYTES = re.compile(rb"\s*[{\[]")
+
+# Binary frames: 4-byte little-endian header length, JSON header, raw attachment bytes
+_FRAME_HEADER_LEN = struct.Struct("<I")
+
+
+def _split_binary_frame(raw_message: bytes) -> tuple[dict[str, Any], memoryview] | None:
+    """Split a binary frame into its JSON header and raw payload.
+
+    Args:
+        raw_message: Binary WebSocket frame
+
+    Returns:
+        Tuple of (header, payload view), or None if the frame is not in binary format
+    """
+    if len(raw_message) < _FRAME_HEADER_LEN.size:
+        return None
+
+    (header_len,) = _FRAME_HEADER_LEN.unpack_from(raw_message)
+    header_end = _FRAME_HEADER_LEN.size + header_len
+    # a JSON text sent as a binary frame never has a JSON object right after 4 bytes
+    if header_end > len(raw_message) or raw_message[_FRAME_HEADER_LEN.size] != ord("{"):
+        return None
+
+    view = memoryview(raw_message)
+    try:
+        header = json_loads(view[_FRAME_HEADER_LEN.size : header_end].tobytes())
+    except ValueError:
+        return None
+    if not isinstance(header, dict):
+        return None
+    return header, view[header_end:]
 
 
 class WebSocketGateway(GatewayProvider):
@@ -27,6 +97,14 @@ class WebSocketGateway(GatewayProvider):
     """
 
     gateway_type = GatewayType.WEBSOCKET
+    RESPONSE_CAPS = frozenset(
+        {
+            ResponseCapability.TEXT,
+            ResponseCapability.IMAGE,
+            ResponseCapability.AUDIO,
+            ResponseCapability.VIDEO,
+        }
+    )
 
     def __init__(
         self,
@@ -37,20 +115,18 @@ class WebSocketGateway(GatewayProvider):
 
         Args:
             name: Provider name
-            config: Provider configuration with host and port
+            config: Provider configuration with host, port and optional
+                receive_queue_size (frames buffered per client before reads pause)
         """
         super().__init__(name, config)
-        self._response_capabilities = {
-            ResponseCapability.TEXT,
-            ResponseCapability.IMAGE,
-            ResponseCapability.AUDIO,
-            ResponseCapability.VIDEO,
-        }
         self.host = config.get("host", "0.0.0.0") if config else "0.0.0.0"
         self.port = config.get("port", 8765) if config else 8765
+        self._receive_queue_size = int(config.get("receive_queue_size", 32)) if config else 32
         self._server: Any = None
         self._clients: dict[str, WebSocketServerProtocol] = {}
         self._client_channels: dict[str, str] = {}
+        self._channel_to_client: dict[str, str] = {}
+        self._io_executor: ThreadPoolExecutor | None = None
 
     async def initialize(self) -> None:
         """Initialize the WebSocket gateway."""
@@ -61,6 +137,9 @@ class WebSocketGateway(GatewayProvider):
         self._set_status(ProviderStatus.STARTING)
         self._stop_event.clear()
         self._running = True
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=get_io_pool_size(), thread_name_prefix="websocket-io"
+        )
 
         try:
             self._server = await websockets.serve(
@@ -93,19 +172,21 @@ class WebSocketGateway(GatewayProvider):
             self._server.close()
             await self._server.wait_closed()
 
-        # close all client connections gracefully
-        close_tasks = []
-        for client_id, websocket in list(self._clients.items()):
-            try:
-                close_tasks.append(websocket.close(1001, "Server shutting down"))
-            except Exception:
-                pass
+        # close all client connections gracefully; the dict is only cleared after gather
+        close_tasks = [
+            websocket.close(1001, "Server shutting down") for websocket in self._clients.values()
+        ]
 
         if close_tasks:
             await asyncio.gather(*close_tasks, return_exceptions=True)
 
         self._clients.clear()
         self._client_channels.clear()
+        self._channel_to_client.clear()
+
+        if self._io_executor:
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+            self._io_executor = None
 
         self._set_status(ProviderStatus.STOPPED)
         self._logger.info("websocket_gateway_stopped")
@@ -129,11 +210,12 @@ class WebSocketGateway(GatewayProvider):
             websocket: WebSocket connection
             path: Connection path
         """
-        client_id = str(uuid4())
+        client_id = new_id()
         channel_id = self.build_channel_id(client_id)
 
         self._clients[client_id] = websocket
         self._client_channels[client_id] = channel_id
+        self._channel_to_client[channel_id] = client_id
 
         self._logger.info(
             "websocket_client_connected",
@@ -141,27 +223,20 @@ class WebSocketGateway(GatewayProvider):
             channel_id=channel_id,
         )
 
+        # bounded queue between receiving and processing: when processing lags,
+        # reads from this client pause instead of buffering without limit
+        queue: asyncio.Queue[str | bytes | None] = asyncio.Queue(self._receive_queue_size)
+        processor = asyncio.create_task(self._process_loop(queue, client_id, channel_id))
+
         try:
             # send welcome message
-            await websocket.send(
-                json.dumps(
-                    {
-                        "type": "connected",
-                        "client_id": client_id,
-                        "channel_id": channel_id,
-                    }
-                )
-            )
+            await websocket.send(_WELCOME_TEMPLATE % (client_id, channel_id))
 
             # handle messages until connection closed or stop requested
             async for raw_message in websocket:
                 if self._stop_event.is_set():
                     break
-                await self._process_raw_message(
-                    raw_message,
-                    client_id,
-                    channel_id,
-                )
+                await queue.put(raw_message)
 
         except websockets.exceptions.ConnectionClosed:
             self._logger.info(
@@ -175,8 +250,36 @@ class WebSocketGateway(GatewayProvider):
                 error=str(e),
             )
         finally:
-            self._clients.pop(client_id, None)
-            self._client_channels.pop(client_id, None)
+            try:
+                if self._stop_event.is_set():
+                    processor.cancel()
+                else:
+                    # let frames already received finish processing
+                    await queue.put(None)
+                    await processor
+            except asyncio.CancelledError:
+                processor.cancel()
+                raise
+            finally:
+                self._clients.pop(client_id, None)
+                self._client_channels.pop(client_id, None)
+                self._channel_to_client.pop(channel_id, None)
+
+    async def _process_loop(
+        self,
+        queue: asyncio.Queue[str | bytes | None],
+        client_id: str,
+        channel_id: str,
+    ) -> None:
+        """Process frames received from one client, in order, until the None sentinel.
+
+        Args:
+            queue: Frames received from the client
+            client_id: Client identifier
+            channel_id: Channel identifier
+        """
+        while (raw_message := await queue.get()) is not None:
+            await self._process_raw_message(raw_message, client_id, channel_id)
 
     async def _process_raw_message(
         self,
@@ -199,12 +302,30 @@ class WebSocketGateway(GatewayProvider):
                 }
             ]
         }
+
+        Binary frames carry one attachment without base64: a 4-byte little-endian
+        header length, a JSON header in the format above with an optional
+        "attachment" object (filename, content_type, metadata), then the raw bytes.
         """
         try:
+            data = None
             if isinstance(raw_message, bytes):
-                raw_message = raw_message.decode("utf-8")
-
-            data = json.loads(raw_message)
+                frame = _split_binary_frame(raw_message)
+                if frame is not None:
+                    data, payload = frame
+                    if payload:
+                        raw_att = data.get("attachment") or {}
+                        data["attachments"] = [{**raw_att, "data": payload}]
+                elif not _JSON_START_BYTES.match(raw_message):
+                    raw_message = raw_message.decode("utf-8")
+                # JSON bytes are parsed as-is, without a decoded str copy
+
+            if data is None:
+                # plain text frames skip the parser and its exception path
+                if isinstance(raw_message, str) and not _JSON_START.match(raw_message):
+                    await self._handle_plain_text(raw_message, client_id, channel_id)
+                    return
+                data = json_loads(raw_message)
 
             message_type_str = data.get("type", "text")
             text = data.get("text") or data.get("content") or data.get("message")
@@ -212,24 +333,16 @@ class WebSocketGateway(GatewayProvider):
             raw_attachments = data.get("attachments", [])
 
             # determine message type
-            message_type = MessageType.TEXT
-            if message_type_str == "image":
-                message_type = MessageType.IMAGE
-            elif message_type_str == "video":
-                message_type = MessageType.VIDEO
-            elif message_type_str == "audio":
-                message_type = MessageType.AUDIO
-            elif message_type_str == "file":
-                message_type = MessageType.FILE
+            message_type = MESSAGE_TYPE_BY_VALUE.get(str(message_type_str), MessageType.TEXT)
 
             # process attachments
             attachments = []
             for raw_att in raw_attachments:
-                attachment = self._process_attachment(raw_att)
+                attachment = await self._process_attachment(raw_att)
                 if attachment:
                     attachments.append(attachment)
                     if message_type == MessageType.TEXT and attachments:
-                        message_type = self._detect_message_type(attachment)
+                        message_type = message_type_for_content_type(attachment.content_type)
 
             if not text and not attachments:
                 return
@@ -259,14 +372,9 @@ class WebSocketGateway(GatewayProvider):
 
         except json.JSONDecodeError:
             # treat as plain text
-            message = InboundMessage(
-                channel_id=channel_id,
-                gateway=self.gateway_type,
-                message_type=MessageType.TEXT,
-                text=str(raw_message),
-                metadata={"client_id": client_id},
-            )
-            await self._handle_message(message)
+            if isinstance(raw_message, bytes):
+                raw_message = raw_message.decode("utf-8", errors="replace")
+            await self._handle_plain_text(raw_message, client_id, channel_id)
 
         except Exception as e:
             self._logger.error(
@@ -275,22 +383,59 @@ class WebSocketGateway(GatewayProvider):
                 error=str(e),
             )
 
-    def _process_attachment(self, raw_att: dict[str, Any]) -> Attachment | None:
-        """Process a raw attachment from WebSocket message."""
+    async def _handle_plain_text(self, text: str, client_id: str, channel_id: str) -> None:
+        """Handle a frame that is not JSON as a plain text message."""
+        message = InboundMessage(
+            channel_id=channel_id,
+            gateway=self.gateway_type,
+            message_type=MessageType.TEXT,
+            text=text,
+            metadata={"client_id": client_id},
+        )
+        await self._handle_message(message)
+
+    async def _process_attachment(self, raw_att: dict[str, Any]) -> Attachment | None:
+        """Process a raw attachment from WebSocket message.
+
+        The data is base64 text for JSON messages, or a raw payload view for binary frames.
+        """
         filename = raw_att.get("filename")
         content_type = raw_att.get("content_type")
-        data_b64 = raw_att.get("data")
+        raw_data = raw_att.get("data")
 
-        if not filename or not data_b64:
+        if not filename or not raw_data:
             return None
 
         try:
-            data = base64.b64decode(data_b64)
-
             if not content_type:
                 content_type, _ = mimetypes.guess_type(filename)
                 content_type = content_type or "application/octet-stream"
 
+            if not isinstance(raw_data, str):
+                # binary frame payload: validate the header fields by hand, then copy the view
+                metadata = raw_att.get("metadata") or {}
+                if not (
+                    isinstance(filename, str)
+                    and isinstance(content_type, str)
+                    and isinstance(metadata, dict)
+                ):
+                    raise ValueError("invalid attachment header")
+                data = bytes(raw_data)
+                return Attachment.from_trusted(
+                    filename=filename,
+                    content_type=content_type,
+                    size=len(data),
+                    data=data,
+                    metadata=metadata,
+                )
+
+            if len(raw_data) >= _OFFLOAD_B64_MIN_LEN:
+                data = await asyncio.get_running_loop().run_in_executor(
+                    self._io_executor, _b64decode, raw_data
+                )
+            else:
+                data = _b64decode(raw_data)
+
             return Attachment(
                 filename=filename,
                 content_type=content_type,
@@ -307,27 +452,9 @@ class WebSocketGateway(GatewayProvider):
             )
             return None
 
-    def _detect_message_type(self, attachment: Attachment) -> MessageType:
-        """Detect message type from attachment content type."""
-        ct = attachment.content_type.lower()
-
-        if ct.startswith("image/"):
-            return MessageType.IMAGE
-        elif ct.startswith("video/"):
-            return MessageType.VIDEO
-        elif ct.startswith("audio/"):
-            return MessageType.AUDIO
-        else:
-            return MessageType.FILE
-
     async def send(self, message: OutboundMessage) -> bool:
         """Send a message to a WebSocket client."""
-        # find client by channel_id
-        target_client_id = None
-        for client_id, channel_id in self._client_channels.items():
-            if channel_id == message.channel_id:
-                target_client_id = client_id
-                break
+        target_client_id = self._channel_to_client.get(message.channel_id)
 
         if not target_client_id:
             self._logger.warning(
@@ -345,7 +472,7 @@ class WebSocketGateway(GatewayProvider):
                 "type": "message",
                 "id": message.id,
                 "text": message.text,
-                "timestamp": message.timestamp.isoformat(),
+                "timestamp": message.timestamp_iso,
             }
 
             if message.reply_to:
@@ -362,7 +489,7 @@ class WebSocketGateway(GatewayProvider):
                     for a in message.attachments
                 ]
 
-            await websocket.send(json.dumps(response_data))
+            await websocket.send(json_dumps(response_data))
 
             self._logger.info(
                 "websocket_message_sent",
@@ -382,27 +509,41 @@ class WebSocketGateway(GatewayProvider):
 
     async def broadcast(self, message: OutboundMessage) -> int:
         """Broadcast a message to all connected clients."""
-        success_count = 0
-
         response_data = {
             "type": "broadcast",
             "id": message.id,
             "text": message.text,
-            "timestamp": message.timestamp.isoformat(),
+            "timestamp": message.timestamp_iso,
         }
 
-        for client_id, websocket in self._clients.items():
-            try:
-                await websocket.send(json.dumps(response_data))
-                success_count += 1
-            except Exception as e:
-                self._logger.error(
-                    "websocket_broadcast_error",
-                    client_id=client_id,
-                    error=str(e),
-                )
+        # serialize once, then send to every client concurrently
+        payload = json_dumps(response_data)
+        results = await asyncio.gather(
+            *(
+                self._safe_send(websocket, payload, client_id)
+                for client_id, websocket in self._clients.items()
+            )
+        )
 
-        return success_count
+        return sum(results)
+
+    async def _safe_send(
+        self,
+        websocket: WebSocketServerProtocol,
+        payload: str,
+        client_id: str,
+    ) -> bool:
+        """Send a broadcast payload to one client, logging instead of raising on failure."""
+        try:
+            await websocket.send(payload)
+            return True
+        except Exception as e:
+            self._logger.error(
+                "websocket_broadcast_error",
+                client_id=client_id,
+                error=str(e),
+            )
+            return False
 
     @property
     def client_count(self) -> int:
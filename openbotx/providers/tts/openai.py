@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 from typing import Any
 
+from openbotx.helpers.openai_client import acquire_openai_client, release_openai_client
 from openbotx.models.enums import ProviderStatus, TTSProviderType
 from openbotx.providers.base import ProviderHealth
 from openbotx.providers.tts.base import TTSProvider, TTSResult
@@ -31,6 +32,7 @@ class OpenAITTSProvider(TTSProvider):
         self.voice = config.get("voice", "alloy") if config else "alloy"
         self.model = config.get("model", "tts-1") if config else "tts-1"
         self._client: Any = None
+        self._api_key: str | None = None
 
     async def initialize(self) -> None:
         """Initialize the OpenAI TTS provider."""
@@ -41,15 +43,14 @@ class OpenAITTSProvider(TTSProvider):
         self._set_status(ProviderStatus.STARTING)
 
         try:
-            from openai import AsyncOpenAI
-
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 self._logger.warning("openai_api_key_not_set")
                 self._set_status(ProviderStatus.ERROR)
                 return
 
-            self._client = AsyncOpenAI(api_key=api_key)
+            self._client = acquire_openai_client(api_key)
+            self._api_key = api_key
             self._set_status(ProviderStatus.RUNNING)
             self._logger.info("openai_tts_started", voice=self.voice)
 
@@ -65,7 +66,10 @@ class OpenAITTSProvider(TTSProvider):
 
     async def stop(self) -> None:
         """Stop the OpenAI TTS provider."""
+        if self._client and self._api_key:
+            await release_openai_client(self._api_key)
         self._client = None
+        self._api_key = None
         self._set_status(ProviderStatus.STOPPED)
 
     async def synthesize(
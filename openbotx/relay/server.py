@@ -8,11 +8,16 @@ then ws://.../cdp.
 """
 
 import asyncio
+import functools
+import ipaddress
+import itertools
 import json
+from collections.abc import Callable
 from typing import Any
 
 from aiohttp import web
 
+from openbotx.helpers.fast_json import json_dumps_bytes, json_loads
 from openbotx.helpers.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,88 +28,310 @@ DEFAULT_RELAY_HOST = "127.0.0.1"
 
 # Shared relay state (one server per process)
 _extension_ws: web.WebSocketResponse | None = None
-_cdp_clients: set[web.WebSocketResponse] = set()
+# CDP client -> its queue of UTF-8 encoded text frames, drained by one writer task per client
+_cdp_clients: dict[web.WebSocketResponse, asyncio.Queue[bytes]] = {}
+# sessionId -> target entry; each targetInfo is stored with "attached": True and
+# updated in place, so readers can hand it out without copying
 _connected_targets: dict[str, dict[str, Any]] = {}
+# targetId -> the same entries, kept in step with _connected_targets
+_targets_by_tid: dict[str, dict[str, Any]] = {}
+# Bumped whenever _connected_targets changes; keys the cached /json/list body
+_targets_generation = 0
+_json_list_cache: tuple[int, str, bytes] | None = None
 _pending_extension: dict[int, asyncio.Future[Any]] = {}
-_next_extension_id = 1
+_extension_ids = itertools.count(1)
 _extensions_lock = asyncio.Lock()
 
+# Message types checked per received frame, bound once instead of per lookup
+_WS_TEXT = web.WSMsgType.TEXT
+_WS_END = frozenset({web.WSMsgType.CLOSE, web.WSMsgType.ERROR, web.WSMsgType.CLOSED})
+
+# Fixed keepalive frames exchanged with the extension
+_PING_FRAME = json_dumps_bytes({"method": "ping"})
+_PONG_FRAME = json_dumps_bytes({"method": "pong"})
+
+# Peer addresses seen on nearly every request; anything else goes through ipaddress
+_LOOPBACK_EXACT = frozenset({"127.0.0.1", "::1"})
+
+# Bind addresses that can only accept loopback peers
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+# Seconds to wait for the extension to answer a forwarded command
+_EXTENSION_TIMEOUT = 30.0
+
+# Messages buffered per CDP client; a client this far behind is disconnected
+_CDP_SEND_QUEUE_SIZE = 1024
+
+# Most messages a CDP writer takes from its queue per wakeup
+_CDP_WRITE_BATCH = 64
+
+# Seconds Target.targetInfoChanged events are held so a burst per target goes out once
+_TARGET_INFO_DEBOUNCE = 0.05
+# targetId -> (sessionId, merged targetInfo) waiting for the next flush
+_pending_info_changes: dict[str, tuple[Any, dict[str, Any]]] = {}
+_info_flush_handle: asyncio.TimerHandle | None = None
+
+
+@functools.lru_cache(maxsize=64)
+def _is_loopback_address(remote: str) -> bool:
+    try:
+        addr = ipaddress.ip_address(remote)
+    except ValueError:
+        return False
+    # IPv4-mapped IPv6 (::ffff:127.x.x.x) is only reported as loopback from Python 3.13
+    mapped = getattr(addr, "ipv4_mapped", None)
+    return (mapped or addr).is_loopback
+
 
 def _is_loopback(remote: str | None) -> bool:
     if not remote:
         return False
-    if remote == "127.0.0.1":
-        return True
-    if remote.startswith("127."):
-        return True
-    if remote == "::1":
-        return True
-    if remote.startswith("::ffff:127."):
+    if remote in _LOOPBACK_EXACT:
         return True
-    return False
+    return _is_loopback_address(remote)
 
 
 def _cdp_ws_url(host: str, port: int) -> str:
     return f"ws://{host}:{port}/cdp"
 
 
+@functools.lru_cache(maxsize=16)
+def _cdp_ws_url_for_host(host_header: str) -> str:
+    """CDP WebSocket URL for a request's Host header (empty means the default address)."""
+    host_header = host_header.strip() or f"{DEFAULT_RELAY_HOST}:{DEFAULT_RELAY_PORT}"
+    if ":" in host_header:
+        host, port_str = host_header.rsplit(":", 1)
+        try:
+            port = int(port_str)
+        except ValueError:
+            port = DEFAULT_RELAY_PORT
+    else:
+        host = host_header
+        port = DEFAULT_RELAY_PORT
+    return _cdp_ws_url(host, port)
+
+
+@functools.lru_cache(maxsize=32)
+def _json_version_body(cdp_url: str, connected: bool) -> bytes:
+    payload = {
+        "Browser": "OpenBotX/extension-relay",
+        "Protocol-Version": "1.3",
+    }
+    if connected:
+        payload["webSocketDebuggerUrl"] = cdp_url
+    return json_dumps_bytes(payload)
+
+
+def _expire(fut: asyncio.Future[Any]) -> None:
+    if not fut.done():
+        fut.set_exception(TimeoutError())
+
+
 async def _send_to_extension(payload: dict[str, Any]) -> Any:
-    global _extension_ws, _pending_extension, _next_extension_id
     ws = _extension_ws
     if not ws or ws.closed:
         raise ConnectionError("Chrome extension not connected")
-    req_id = _next_extension_id
-    _next_extension_id += 1
+    req_id = next(_extension_ids)
     payload["id"] = req_id
-    fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    loop = asyncio.get_running_loop()
+    fut: asyncio.Future[Any] = loop.create_future()
     _pending_extension[req_id] = fut
+    # a timer handle instead of wait_for's wrapper around the future
+    timeout = loop.call_later(_EXTENSION_TIMEOUT, _expire, fut)
     try:
-        await ws.send_str(json.dumps(payload))
-        return await asyncio.wait_for(fut, timeout=30.0)
+        await ws.send_frame(json_dumps_bytes(payload), _WS_TEXT)
+        return await fut
     finally:
+        timeout.cancel()
         _pending_extension.pop(req_id, None)
 
 
-def _broadcast_to_cdp(evt: dict[str, Any]) -> None:
-    msg = json.dumps(evt)
-    for ws in list(_cdp_clients):
-        if not ws.closed:
-            try:
-                asyncio.create_task(_safe_send(ws, msg))
-            except Exception:
-                pass
+def _targets_changed() -> None:
+    global _targets_generation
+    _targets_generation += 1
 
 
-async def _safe_send(ws: web.WebSocketResponse, msg: str) -> None:
+def _queue_to_cdp(ws: web.WebSocketResponse, msg: bytes) -> None:
+    """Queue an encoded message for a CDP client's writer task.
+
+    A client whose queue is full is too slow to keep up and gets disconnected,
+    rather than silently losing CDP messages.
+    """
+    queue = _cdp_clients.get(ws)
+    if queue is None or ws.closed:
+        return
     try:
-        await ws.send_str(msg)
-    except Exception:
-        pass
+        queue.put_nowait(msg)
+    except asyncio.QueueFull:
+        _drop_slow_cdp_client(ws)
+
+
+def _drop_slow_cdp_client(ws: web.WebSocketResponse) -> None:
+    logger.warning("cdp_client_too_slow", queue_size=_CDP_SEND_QUEUE_SIZE)
+    _cdp_clients.pop(ws, None)
+    asyncio.create_task(ws.close(code=1013, message=b"client too slow"))
+
+
+async def _cdp_writer(ws: web.WebSocketResponse, queue: asyncio.Queue[bytes]) -> None:
+    """Send queued messages to one CDP client, in order, until it closes.
+
+    Messages are already UTF-8 encoded, so they go out as text frames without
+    the per-client encode that send_str would do. Bursts are drained in one
+    wakeup, but every CDP message keeps its own frame: CDP clients do not
+    accept batched messages.
+    """
+    while not ws.closed:
+        batch = [await queue.get()]
+        while len(batch) < _CDP_WRITE_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            for msg in batch:
+                await ws.send_frame(msg, _WS_TEXT)
+        except Exception:
+            break
+
+
+def _broadcast_to_cdp(evt: dict[str, Any]) -> None:
+    # encode once, share the same bytes with every client
+    msg = json_dumps_bytes(evt)
+    # iterate the live dict; slow clients are only dropped once the loop is done
+    slow: list[web.WebSocketResponse] | None = None
+    for ws, queue in _cdp_clients.items():
+        if ws.closed:
+            continue
+        try:
+            queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            if slow is None:
+                slow = []
+            slow.append(ws)
+    if slow:
+        for ws in slow:
+            _drop_slow_cdp_client(ws)
+
+
+def _queue_info_change(tid: str, session_id: Any, target_info: dict[str, Any]) -> None:
+    """Hold a Target.targetInfoChanged event, merging it into any pending one for tid."""
+    global _info_flush_handle
+    pending = _pending_info_changes.get(tid)
+    if pending is None:
+        _pending_info_changes[tid] = (session_id, dict(target_info))
+    else:
+        pending[1].update(target_info)
+        _pending_info_changes[tid] = (session_id, pending[1])
+    if _info_flush_handle is None:
+        _info_flush_handle = asyncio.get_running_loop().call_later(
+            _TARGET_INFO_DEBOUNCE, _flush_info_changes
+        )
+
+
+def _flush_info_changes() -> None:
+    """Broadcast one merged Target.targetInfoChanged per target with pending changes."""
+    global _info_flush_handle
+    if _info_flush_handle is not None:
+        _info_flush_handle.cancel()
+        _info_flush_handle = None
+    pending = list(_pending_info_changes.values())
+    _pending_info_changes.clear()
+    for session_id, target_info in pending:
+        _broadcast_to_cdp(
+            {
+                "method": "Target.targetInfoChanged",
+                "params": {"targetInfo": target_info},
+                "sessionId": session_id,
+            }
+        )
 
 
 def _send_response_to_cdp(ws: web.WebSocketResponse, res: dict[str, Any]) -> None:
-    if ws.closed:
-        return
-    asyncio.create_task(_safe_send(ws, json.dumps(res)))
+    _queue_to_cdp(ws, json_dumps_bytes(res))
 
 
-def _ensure_target_events_for_client(ws: web.WebSocketResponse, mode: str) -> None:
-    for target in _connected_targets.values():
+def _target_event_frame(target: dict[str, Any], mode: str) -> bytes:
+    """Encoded Target.attachedToTarget ("autoAttach") or Target.targetCreated event.
+
+    The frame is cached on the target entry and dropped when the extension
+    reports a targetInfo change.
+    """
+    key = "_attached_frame" if mode == "autoAttach" else "_created_frame"
+    frame = target.get(key)
+    if frame is None:
         if mode == "autoAttach":
             evt = {
                 "method": "Target.attachedToTarget",
                 "params": {
                     "sessionId": target["sessionId"],
-                    "targetInfo": {**target["targetInfo"], "attached": True},
+                    "targetInfo": target["targetInfo"],
                     "waitingForDebugger": False,
                 },
             }
         else:
             evt = {
                 "method": "Target.targetCreated",
-                "params": {"targetInfo": {**target["targetInfo"], "attached": True}},
+                "params": {"targetInfo": target["targetInfo"]},
             }
-        asyncio.create_task(_safe_send(ws, json.dumps(evt)))
+        frame = target[key] = json_dumps_bytes(evt)
+    return frame
+
+
+def _ensure_target_events_for_client(ws: web.WebSocketResponse, mode: str) -> None:
+    for target in _connected_targets.values():
+        _queue_to_cdp(ws, _target_event_frame(target, mode))
+
+
+def _cdp_browser_get_version(params: dict[str, Any], session_id: Any) -> Any:
+    return {
+        "protocolVersion": "1.3",
+        "product": "Chrome/OpenBotX-Extension-Relay",
+        "revision": "0",
+        "userAgent": "OpenBotX-Extension-Relay",
+        "jsVersion": "V8",
+    }
+
+
+def _cdp_empty_result(params: dict[str, Any], session_id: Any) -> Any:
+    return {}
+
+
+def _cdp_target_get_targets(params: dict[str, Any], session_id: Any) -> Any:
+    return {"targetInfos": [t["targetInfo"] for t in _connected_targets.values()]}
+
+
+def _cdp_target_get_target_info(params: dict[str, Any], session_id: Any) -> Any:
+    target_id = params.get("targetId")
+    if target_id:
+        t = _targets_by_tid.get(target_id)
+        if t:
+            return {"targetInfo": t["targetInfo"]}
+    if session_id and session_id in _connected_targets:
+        t = _connected_targets[session_id]
+        return {"targetInfo": t["targetInfo"]}
+    first = next(iter(_connected_targets.values()), None)
+    if first:
+        return {"targetInfo": first["targetInfo"]}
+    return {"targetInfo": {"targetId": "", "type": "page", "title": "", "url": ""}}
+
+
+def _cdp_target_attach_to_target(params: dict[str, Any], session_id: Any) -> Any:
+    target_id = params.get("targetId")
+    if not target_id:
+        raise ValueError("targetId required")
+    t = _targets_by_tid.get(target_id)
+    if t:
+        return {"sessionId": t["sessionId"]}
+    raise ValueError("target not found")
+
+
+# CDP methods the relay answers itself; everything else is forwarded to the extension
+_CDP_HANDLERS: dict[str, Callable[[dict[str, Any], Any], Any]] = {
+    "Browser.getVersion": _cdp_browser_get_version,
+    "Browser.setDownloadBehavior": _cdp_empty_result,
+    "Target.setAutoAttach": _cdp_empty_result,
+    "Target.setDiscoverTargets": _cdp_empty_result,
+    "Target.getTargets": _cdp_target_get_targets,
+    "Target.getTargetInfo": _cdp_target_get_target_info,
+    "Target.attachToTarget": _cdp_target_attach_to_target,
+}
 
 
 async def _route_cdp_command(cmd: dict[str, Any]) -> Any:
@@ -112,45 +339,9 @@ async def _route_cdp_command(cmd: dict[str, Any]) -> Any:
     params = cmd.get("params") or {}
     session_id = cmd.get("sessionId")
 
-    if method == "Browser.getVersion":
-        return {
-            "protocolVersion": "1.3",
-            "product": "Chrome/OpenBotX-Extension-Relay",
-            "revision": "0",
-            "userAgent": "OpenBotX-Extension-Relay",
-            "jsVersion": "V8",
-        }
-    if method == "Browser.setDownloadBehavior":
-        return {}
-    if method in ("Target.setAutoAttach", "Target.setDiscoverTargets"):
-        return {}
-    if method == "Target.getTargets":
-        return {
-            "targetInfos": [
-                {**t["targetInfo"], "attached": True} for t in _connected_targets.values()
-            ],
-        }
-    if method == "Target.getTargetInfo":
-        target_id = (params or {}).get("targetId")
-        if target_id:
-            for t in _connected_targets.values():
-                if t["targetId"] == target_id:
-                    return {"targetInfo": t["targetInfo"]}
-        if session_id and session_id in _connected_targets:
-            t = _connected_targets[session_id]
-            return {"targetInfo": t["targetInfo"]}
-        first = next(iter(_connected_targets.values()), None)
-        if first:
-            return {"targetInfo": first["targetInfo"]}
-        return {"targetInfo": {"targetId": "", "type": "page", "title": "", "url": ""}}
-    if method == "Target.attachToTarget":
-        target_id = (params or {}).get("targetId")
-        if not target_id:
-            raise ValueError("targetId required")
-        for t in _connected_targets.values():
-            if t["targetId"] == target_id:
-                return {"sessionId": t["sessionId"]}
-        raise ValueError("target not found")
+    handler = _CDP_HANDLERS.get(method)
+    if handler is not None:
+        return handler(params, session_id)
 
     # Forward to extension
     return await _send_to_extension(
@@ -168,6 +359,10 @@ async def _route_cdp_command(cmd: dict[str, Any]) -> Any:
 # ---- HTTP routes ----
 
 
+def _json_response(data: Any) -> web.Response:
+    return web.Response(body=json_dumps_bytes(data), content_type="application/json")
+
+
 async def _handle_root(request: web.Request) -> web.Response:
     if request.method == "HEAD":
         return web.Response(status=200)
@@ -175,45 +370,23 @@ async def _handle_root(request: web.Request) -> web.Response:
 
 
 async def _handle_extension_status(request: web.Request) -> web.Response:
-    return web.json_response({"connected": _extension_ws is not None and not _extension_ws.closed})
+    return _json_response({"connected": _extension_ws is not None and not _extension_ws.closed})
 
 
 async def _handle_json_version(request: web.Request) -> web.Response:
-    host_header = (
-        request.headers.get("Host", "").strip() or f"{DEFAULT_RELAY_HOST}:{DEFAULT_RELAY_PORT}"
+    cdp_url = _cdp_ws_url_for_host(request.headers.get("Host", ""))
+    connected = _extension_ws is not None and not _extension_ws.closed
+    return web.Response(
+        body=_json_version_body(cdp_url, connected), content_type="application/json"
     )
-    if ":" in host_header:
-        host, port_str = host_header.rsplit(":", 1)
-        try:
-            port = int(port_str)
-        except ValueError:
-            port = DEFAULT_RELAY_PORT
-    else:
-        host = host_header
-        port = DEFAULT_RELAY_PORT
-    payload = {
-        "Browser": "OpenBotX/extension-relay",
-        "Protocol-Version": "1.3",
-    }
-    if _extension_ws and not _extension_ws.closed:
-        payload["webSocketDebuggerUrl"] = _cdp_ws_url(host, port)
-    return web.json_response(payload)
 
 
 async def _handle_json_list(request: web.Request) -> web.Response:
-    host_header = (
-        request.headers.get("Host", "").strip() or f"{DEFAULT_RELAY_HOST}:{DEFAULT_RELAY_PORT}"
-    )
-    if ":" in host_header:
-        host, port_str = host_header.rsplit(":", 1)
-        try:
-            port = int(port_str)
-        except ValueError:
-            port = DEFAULT_RELAY_PORT
-    else:
-        host = host_header
-        port = DEFAULT_RELAY_PORT
-    cdp_url = _cdp_ws_url(host, port)
+    global _json_list_cache
+    cdp_url = _cdp_ws_url_for_host(request.headers.get("Host", ""))
+    cached = _json_list_cache
+    if cached and cached[0] == _targets_generation and cached[1] == cdp_url:
+        return web.Response(body=cached[2], content_type="application/json")
     list_data = [
         {
             "id": t["targetId"],
@@ -226,7 +399,9 @@ async def _handle_json_list(request: web.Request) -> web.Response:
         }
         for t in _connected_targets.values()
     ]
-    return web.json_response(list_data)
+    body = json_dumps_bytes(list_data)
+    _json_list_cache = (_targets_generation, cdp_url, body)
+    return web.Response(body=body, content_type="application/json")
 
 
 async def _handle_json_activate(request: web.Request) -> web.Response:
@@ -271,14 +446,14 @@ async def _handle_json_close(request: web.Request) -> web.Response:
 
 
 async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
-    global _extension_ws
+    global _extension_ws, _info_flush_handle
     peer = request.remote
     if not _is_loopback(peer):
         raise web.HTTPForbidden(text="Forbidden")
     if _extension_ws and not _extension_ws.closed:
         raise web.HTTPConflict(text="Extension already connected")
 
-    ws = web.WebSocketResponse()
+    ws = web.WebSocketResponse(compress=False)
     await ws.prepare(request)
     _extension_ws = ws
     logger.info("extension_connected", peer=peer)
@@ -291,7 +466,7 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
             if ws.closed:
                 break
             try:
-                await ws.send_str(json.dumps({"method": "ping"}))
+                await ws.send_frame(_PING_FRAME, _WS_TEXT)
             except Exception:
                 break
 
@@ -302,16 +477,12 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
                 raw = await ws.receive()
             except Exception:
                 break
-            if raw.type != web.WSMsgType.TEXT:
-                if raw.type in (
-                    web.WSMsgType.CLOSE,
-                    web.WSMsgType.ERROR,
-                    web.WSMsgType.CLOSED,
-                ):
+            if raw.type is not _WS_TEXT:
+                if raw.type in _WS_END:
                     break
                 continue
             try:
-                msg = json.loads(raw.data)
+                msg = json_loads(raw.data)
             except json.JSONDecodeError:
                 continue
             if not isinstance(msg, dict):
@@ -320,7 +491,7 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
             # ping -> pong
             if msg.get("method") == "ping":
                 try:
-                    await ws.send_str(json.dumps({"method": "pong"}))
+                    await ws.send_frame(_PONG_FRAME, _WS_TEXT)
                 except Exception:
                     pass
                 continue
@@ -360,11 +531,19 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
                     next_tid = tid
                     prev_tid = prev["targetId"] if prev else None
                     changed = bool(prev and prev_tid and prev_tid != next_tid)
-                    _connected_targets[sid] = {
+                    if _pending_info_changes:
+                        # keep held info changes ahead of attach/detach events
+                        _flush_info_changes()
+                    entry = {
                         "sessionId": sid,
                         "targetId": next_tid,
-                        "targetInfo": target_info,
+                        "targetInfo": {**target_info, "attached": True},
                     }
+                    _connected_targets[sid] = entry
+                    if prev_tid and _targets_by_tid.get(prev_tid) is prev:
+                        del _targets_by_tid[prev_tid]
+                    _targets_by_tid[next_tid] = entry
+                    _targets_changed()
                     if changed and prev_tid:
                         _broadcast_to_cdp(
                             {
@@ -385,8 +564,14 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
 
             if evt_method == "Target.detachedFromTarget":
                 detached = evt_params or {}
+                if _pending_info_changes:
+                    _flush_info_changes()
                 if detached.get("sessionId"):
-                    _connected_targets.pop(detached["sessionId"], None)
+                    gone = _connected_targets.pop(detached["sessionId"], None)
+                    if gone is not None:
+                        if _targets_by_tid.get(gone["targetId"]) is gone:
+                            del _targets_by_tid[gone["targetId"]]
+                        _targets_changed()
                 _broadcast_to_cdp(
                     {
                         "method": evt_method,
@@ -401,13 +586,19 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
                 target_info = changed.get("targetInfo") or {}
                 tid = target_info.get("targetId")
                 if tid and (target_info.get("type", "page") == "page"):
-                    for sid, target in list(_connected_targets.items()):
-                        if target["targetId"] != tid:
-                            continue
-                        _connected_targets[sid] = {
-                            **target,
-                            "targetInfo": {**target["targetInfo"], **target_info},
-                        }
+                    target = _targets_by_tid.get(tid)
+                    if target:
+                        info = target["targetInfo"]
+                        info.update(target_info)
+                        info["attached"] = True
+                        target.pop("_attached_frame", None)
+                        target.pop("_created_frame", None)
+                        _targets_changed()
+                if tid:
+                    _queue_info_change(tid, evt_session_id, target_info)
+                    continue
+                if _pending_info_changes:
+                    _flush_info_changes()
                 _broadcast_to_cdp(
                     {
                         "method": evt_method,
@@ -417,7 +608,10 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
                 )
                 continue
 
-            # All other events: broadcast to CDP clients
+            # All other events: broadcast to CDP clients, after any held info changes
+            # so clients never see an event ahead of the info change that preceded it
+            if _pending_info_changes:
+                _flush_info_changes()
             _broadcast_to_cdp(
                 {
                     "method": evt_method,
@@ -435,11 +629,18 @@ async def _ws_extension(request: web.Request) -> web.WebSocketResponse:
             except asyncio.CancelledError:
                 pass
         _extension_ws = None
+        # the clients are closed below, so held info changes are dropped, not sent
+        if _info_flush_handle is not None:
+            _info_flush_handle.cancel()
+            _info_flush_handle = None
+        _pending_info_changes.clear()
         for fut in _pending_extension.values():
             if not fut.done():
                 fut.set_exception(ConnectionError("extension disconnected"))
         _pending_extension.clear()
         _connected_targets.clear()
+        _targets_by_tid.clear()
+        _targets_changed()
         for client in list(_cdp_clients):
             try:
                 await client.close(code=1011, message="extension disconnected")
@@ -461,9 +662,12 @@ async def _ws_cdp(request: web.Request) -> web.WebSocketResponse:
     if not _extension_ws or _extension_ws.closed:
         raise web.HTTPServiceUnavailable(text="Extension not connected")
 
-    ws = web.WebSocketResponse()
+    # loopback only: permessage-deflate would just recompress each shared broadcast per client
+    ws = web.WebSocketResponse(compress=False)
     await ws.prepare(request)
-    _cdp_clients.add(ws)
+    queue: asyncio.Queue[bytes] = asyncio.Queue(_CDP_SEND_QUEUE_SIZE)
+    _cdp_clients[ws] = queue
+    writer = asyncio.create_task(_cdp_writer(ws, queue))
     logger.info("cdp_client_connected", peer=peer)
 
     try:
@@ -472,16 +676,12 @@ async def _ws_cdp(request: web.Request) -> web.WebSocketResponse:
                 raw = await ws.receive()
             except Exception:
                 break
-            if raw.type != web.WSMsgType.TEXT:
-                if raw.type in (
-                    web.WSMsgType.CLOSE,
-                    web.WSMsgType.ERROR,
-                    web.WSMsgType.CLOSED,
-                ):
+            if raw.type is not _WS_TEXT:
+                if raw.type in _WS_END:
                     break
                 continue
             try:
-                cmd = json.loads(raw.data)
+                cmd = json_loads(raw.data)
             except json.JSONDecodeError:
                 continue
             if (
@@ -517,26 +717,9 @@ async def _ws_cdp(request: web.Request) -> web.WebSocketResponse:
                 if cmd.get("method") == "Target.attachToTarget":
                     params = cmd.get("params") or {}
                     target_id = params.get("targetId")
-                    if target_id:
-                        for t in _connected_targets.values():
-                            if t["targetId"] == target_id:
-                                await _safe_send(
-                                    ws,
-                                    json.dumps(
-                                        {
-                                            "method": "Target.attachedToTarget",
-                                            "params": {
-                                                "sessionId": t["sessionId"],
-                                                "targetInfo": {
-                                                    **t["targetInfo"],
-                                                    "attached": True,
-                                                },
-                                                "waitingForDebugger": False,
-                                            },
-                                        }
-                                    ),
-                                )
-                                break  # one target matched
+                    target = _targets_by_tid.get(target_id) if target_id else None
+                    if target:
+                        _queue_to_cdp(ws, _target_event_frame(target, "autoAttach"))
 
                 _send_response_to_cdp(ws, {"id": cmd_id, "sessionId": session_id, "result": result})
             except Exception as e:
@@ -551,7 +734,8 @@ async def _ws_cdp(request: web.Request) -> web.WebSocketResponse:
     except Exception as e:
         logger.debug("cdp_ws_error", error=str(e))
     finally:
-        _cdp_clients.discard(ws)
+        _cdp_clients.pop(ws, None)
+        writer.cancel()
         logger.info("cdp_client_disconnected", peer=peer)
 
     return ws
@@ -561,8 +745,10 @@ def create_relay_app(
     host: str = DEFAULT_RELAY_HOST, port: int = DEFAULT_RELAY_PORT
 ) -> web.Application:
     app = web.Application()
-    # All routes only from loopback
-    app.middlewares.append(_loopback_middleware)
+    # All routes only from loopback; a loopback bind already guarantees that
+    if host not in _LOOPBACK_HOSTS:
+        logger.warning("relay_non_loopback_bind", host=host)
+        app.middlewares.append(_loopback_middleware)
     app.router.add_route("GET", "/", _handle_root)
     app.router.add_route("HEAD", "/", _handle_root)
     app.router.add_get("/extension/status", _handle_extension_status)
@@ -594,7 +780,11 @@ async def run_relay_server(
     host: str = DEFAULT_RELAY_HOST,
     port: int = DEFAULT_RELAY_PORT,
 ) -> None:
-    """Run the browser relay server (HTTP + WebSocket) until shutdown."""
+    """Run the browser relay server (HTTP + WebSocket) until shutdown.
+
+    Runs on the caller's event loop, which is uvloop when the application was
+    started through helpers.event_loop.run or by uvicorn with uvloop installed.
+    """
     app = create_relay_app(host=host, port=port)
     runner = web.AppRunner(app)
     await runner.setup()
@@ -1,54 +1,245 @@
 """Browser tool for OpenBotX - web automation using Playwright."""
 
 import asyncio
+import contextlib
+import functools
 import json
+import os
 import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
 
 from openbotx.core.tools_registry import tool
+from openbotx.helpers.fast_json import json_dumps
 from openbotx.models.tool_result import ToolResult
 
 # lazy import playwright to avoid startup cost
 _browser = None
 _playwright = None
+# one persistent context shared by all tools (cookies, storage and tracing)
+_context = None
+# serializes launch and teardown so concurrent first calls start one browser
+_browser_lock = asyncio.Lock()
+
+# idle pages kept open between tool calls, oldest first: (text only, url key, page)
+_idle_pages: list[tuple[bool, str, Any]] = []
+_PAGE_POOL_SIZE = 4
+
+# helpers installed once per context and called by name from the tools
+# __obx_text(n, trim) cuts the text to n chars in the page so long pages never cross CDP whole
+_INIT_SCRIPT = (
+    "window.__obx_text = (n, trim) => { let t = document.body.innerText; "
+    "if (trim) t = t.trim(); return n ? t.slice(0, n) : t; };"
+)
+
+# resource types text-only pages skip; stylesheets still load since they decide innerText
+_TEXT_ONLY_BLOCKED = frozenset({"image", "media", "font"})
+
 
+def _browser_alive() -> bool:
+    # is_connected() is a local flag Playwright clears when the browser exits, so no CDP ping
+    return _browser is not None and _browser.is_connected()
 
-async def _get_browser():
+
+async def _launch_browser() -> None:
+    """Start Playwright and launch the browser. Caller must hold _browser_lock.
+
+    A browser that crashed or was closed is discarded first, together with its
+    context and pooled pages.
+    """
+    global _browser, _playwright, _context
+
+    if _browser is not None:
+        _idle_pages.clear()
+        _context = None
+        _browser = None
+        if _playwright:
+            with contextlib.suppress(Exception):
+                await _playwright.stop()
+            _playwright = None
+
+    try:
+        from playwright.async_api import async_playwright
+
+        _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(
+            headless=False,
+            args=[
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                "--start-maximized",
+                "--window-position=0,0",
+            ],
+        )
+    except ImportError:
+        raise RuntimeError(
+            "Playwright not installed. Install with: pip install playwright && playwright install chromium"
+        )
+
+
+async def _get_browser() -> Any:
     """Get or create browser instance."""
-    global _browser, _playwright
-
-    if _browser is None:
-        try:
-            from playwright.async_api import async_playwright
-
-            _playwright = await async_playwright().start()
-            _browser = await _playwright.chromium.launch(
-                headless=False,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--start-maximized",
-                    "--window-position=0,0",
-                ],
-            )
-        except ImportError:
-            raise RuntimeError(
-                "Playwright not installed. Install with: pip install playwright && playwright install chromium"
-            )
+    if not _browser_alive():
+        async with _browser_lock:
+            if not _browser_alive():
+                await _launch_browser()
 
     return _browser
 
 
+async def _get_context() -> Any:
+    """Get or create the persistent browser context."""
+    global _context
+
+    if _context is None or not _browser_alive():
+        async with _browser_lock:
+            if not _browser_alive():
+                await _launch_browser()
+            if _context is None:
+                if _browser is None:
+                    raise RuntimeError("Browser is not running")
+                _context = await _browser.new_context()
+                await _context.add_init_script(_INIT_SCRIPT)
+
+    return _context
+
+
+def _clamp(value: int, low: int = 500, high: int = 60_000) -> int:
+    """Clamp a tool argument (milliseconds by default) into [low, high]."""
+    return max(low, min(high, value))
+
+
+def _url_key(url: str) -> str:
+    """Comparable form of a URL: lowercase scheme and host, no trailing slash."""
+    parts = urlsplit(url)
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            parts.query,
+            parts.fragment,
+        )
+    )
+
+
+def _take_idle_page(key: str, text_only: bool) -> tuple[Any, bool]:
+    """Pop an idle page of the given mode, preferring one already showing key's URL.
+
+    Returns:
+        Tuple of (page, already on url), or (None, False) if no page fits
+    """
+    for i in range(len(_idle_pages) - 1, -1, -1):
+        mode, page_key, page = _idle_pages[i]
+        if mode == text_only and page_key == key:
+            del _idle_pages[i]
+            if not page.is_closed():
+                return page, True
+            break
+    i = 0
+    while i < len(_idle_pages):
+        mode, _, page = _idle_pages[i]
+        if mode != text_only:
+            i += 1
+            continue
+        del _idle_pages[i]
+        if not page.is_closed():
+            return page, False
+    return None, False
+
+
+async def _block_heavy_resources(route: Any) -> None:
+    if route.request.resource_type in _TEXT_ONLY_BLOCKED:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def _page_lease(
+    url: str,
+    wait_until: str = "domcontentloaded",
+    timeout: int = 30000,
+    text_only: bool = False,
+    reuse_location: bool = True,
+) -> AsyncIterator[Any]:
+    """Borrow a pooled page showing url.
+
+    A pooled page still on url is reused without navigating again, unless
+    reuse_location is False; otherwise the page is navigated there. The page
+    returns to the pool afterwards, or is closed if the call failed or the
+    pool is full.
+
+    Args:
+        url: URL the page should show
+        wait_until: Load state passed to page.goto
+        timeout: Navigation timeout in milliseconds
+        text_only: Use a page that skips images, media and fonts, for tools
+            that only read text
+        reuse_location: Skip navigation when the page is already on url; tools
+            that read page content pass False so they never see stale state
+
+    Yields:
+        Playwright page
+    """
+    key = _url_key(url)
+    page, on_url = _take_idle_page(key, text_only)
+    if page is None:
+        context = await _get_context()
+        page = await context.new_page()
+        if text_only:
+            await page.route("**/*", _block_heavy_resources)
+    try:
+        if not (on_url and reuse_location):
+            await page.goto(url, wait_until=wait_until, timeout=timeout)
+        # page.url is normalized by the browser, so remember which url it landed on
+        landed = page.url
+        yield page
+    except BaseException:
+        with contextlib.suppress(Exception):
+            await page.close()
+        raise
+
+    if page.is_closed():
+        return
+    # a page that navigated away (e.g. after a click) is keyed by where it is now
+    _idle_pages.append((text_only, key if page.url == landed else _url_key(page.url), page))
+    if len(_idle_pages) > _PAGE_POOL_SIZE:
+        _, _, oldest = _idle_pages.pop(0)
+        with contextlib.suppress(Exception):
+            await oldest.close()
+
+
 async def _cleanup_browser() -> None:
     """Cleanup browser resources (internal)."""
-    global _browser, _playwright
+    global _browser, _playwright, _context
 
-    if _browser:
-        await _browser.close()
-        _browser = None
+    async with _browser_lock:
+        _idle_pages.clear()
+        if _context:
+            with contextlib.suppress(Exception):
+                await _context.close()
+            _context = None
 
-    if _playwright:
-        await _playwright.stop()
-        _playwright = None
+        if _browser:
+            await _browser.close()
+            _browser = None
+
+        if _playwright:
+            await _playwright.stop()
+            _playwright = None
+
+
+async def prewarm_browser() -> None:
+    """Launch the browser ahead of the first tool call to hide the cold start.
+
+    Failures are swallowed; the first real tool call retries the launch and
+    reports the error.
+    """
+    with contextlib.suppress(Exception):
+        await _get_context()
 
 
 async def close_browser_resources() -> None:
@@ -79,26 +270,19 @@ async def tool_browser_navigate(
     result = ToolResult()
 
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-
-        try:
-            await page.goto(url, wait_until=wait_for, timeout=30000)
-            await asyncio.sleep(2)
-
-            # get page info
-            title = await page.title()
+        async with _page_lease(
+            url, wait_until=wait_for, text_only=extract_text, reuse_location=False
+        ) as page:
+            # get page info and content (text or html) concurrently
+            max_length = 10000
             current_url = page.url
-
-            if extract_text:
-                # extract text content
-                content = await page.evaluate("() => document.body.innerText")
-            else:
-                # get html
-                content = await page.content()
+            title, content = await asyncio.gather(
+                page.title(),
+                # one extra char tells whether the text was cut
+                page.evaluate(f"__obx_text({max_length + 1})") if extract_text else page.content(),
+            )
 
             # truncate if too long
-            max_length = 10000
             if len(content) > max_length:
                 content = content[:max_length] + "\n\n[Content truncated...]"
 
@@ -111,9 +295,6 @@ async def tool_browser_navigate(
 
             result.add_text("\n".join(output))
 
-        finally:
-            await page.close()
-
         return result
 
     except Exception as e:
@@ -142,26 +323,21 @@ async def tool_browser_screenshot(
     result = ToolResult()
 
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-
-        try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url, wait_until="networkidle", reuse_location=False) as page:
+            # a reused page skips goto, so still wait for the network to settle
+            await page.wait_for_load_state("networkidle", timeout=30000)
 
             # take screenshot
             with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
                 screenshot_path = f.name
 
-            await page.screenshot(path=screenshot_path, full_page=full_page)
-
-            title = await page.title()
+            _, title = await asyncio.gather(
+                page.screenshot(path=screenshot_path, full_page=full_page),
+                page.title(),
+            )
             result.add_image(path=screenshot_path)
             result.add_text(f"Screenshot of: {title}\nURL: {url}")
 
-        finally:
-            await page.close()
-
         return result
 
     except Exception as e:
@@ -169,6 +345,13 @@ async def tool_browser_screenshot(
         return result
 
 
+# attribute value, or trimmed inner text, of up to 50 matched elements
+_EXTRACT_SCRIPT = (
+    "(elements, attribute) => elements.slice(0, 50).map("
+    "e => attribute ? e.getAttribute(attribute) : e.innerText.trim())"
+)
+
+
 @tool(
     name="browser_extract",
     description="Launch a new browser window, navigate to a URL, and extract elements by CSS. Use only when the user explicitly asks to open or launch a browser.",
@@ -191,30 +374,18 @@ async def tool_browser_extract(
     result = ToolResult()
 
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
-
-            # find elements
-            elements = await page.query_selector_all(selector)
+        async with _page_lease(url, text_only=True, reuse_location=False) as page:
+            # read the first 50 matches in one round trip instead of one per element
+            values = await page.locator(selector).evaluate_all(_EXTRACT_SCRIPT, attribute)
 
-            if not elements:
+            if not values:
                 result.add_text(f"No elements found matching selector: {selector}")
                 return result
 
             extracted = []
-            for i, element in enumerate(elements[:50]):  # limit to 50 elements
-                if attribute:
-                    value = await element.get_attribute(attribute)
-                    if value:
-                        extracted.append(f"{i + 1}. {value}")
-                else:
-                    text = await element.inner_text()
-                    if text.strip():
-                        extracted.append(f"{i + 1}. {text.strip()}")
+            for i, value in enumerate(values):
+                if value:
+                    extracted.append(f"{i + 1}. {value}")
 
             output = [
                 f"# Extracted {len(extracted)} elements",
@@ -226,9 +397,6 @@ async def tool_browser_extract(
 
             result.add_text("\n".join(output))
 
-        finally:
-            await page.close()
-
         return result
 
     except Exception as e:
@@ -257,19 +425,13 @@ async def tool_browser_click(
         Structured tool result
     """
     result = ToolResult()
-    timeout = max(500, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms)
 
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             locator = page.locator(selector).first
             await locator.click(timeout=timeout)
             result.add_text(f"Clicked element: {selector}\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser click failed: {e}")
@@ -301,14 +463,10 @@ async def tool_browser_type(
         Structured tool result
     """
     result = ToolResult()
-    timeout = max(500, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms)
 
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             locator = page.locator(selector).first
             await locator.fill(text, timeout=timeout)
             if submit:
@@ -316,8 +474,6 @@ async def tool_browser_type(
             result.add_text(
                 f"Typed into {selector}\nURL: {url}" + (" (submitted)" if submit else "")
             )
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser type failed: {e}")
@@ -345,22 +501,16 @@ async def tool_browser_wait(
         Structured tool result
     """
     result = ToolResult()
-    timeout = max(500, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms)
 
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             if selector:
                 locator = page.locator(selector).first
                 await locator.wait_for(state="visible", timeout=timeout)
                 result.add_text(f"Element visible: {selector}\nURL: {url}")
             else:
                 result.add_text(f"Page loaded: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser wait failed: {e}")
@@ -388,14 +538,10 @@ async def tool_browser_evaluate(
         Structured tool result with script return value
     """
     result = ToolResult()
-    timeout = max(1000, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms, 1000, 60_000)
 
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=timeout - 2000)
-            await asyncio.sleep(2)
+        async with _page_lease(url, timeout=timeout - 2000) as page:
             s = script.strip()
             body = s if s.startswith("return ") else f"return {s}"
             value = await page.evaluate(f"() => {{ {body} }}")
@@ -403,8 +549,6 @@ async def tool_browser_evaluate(
                 result.add_text(str(value))
             else:
                 result.add_text("ok")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser evaluate failed: {e}")
@@ -423,17 +567,11 @@ async def tool_browser_hover(
 ) -> ToolResult:
     """Hover over an element on the page."""
     result = ToolResult()
-    timeout = max(500, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms)
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             await page.locator(selector).first.hover(timeout=timeout)
             result.add_text(f"Hovered: {selector}\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser hover failed: {e}")
@@ -453,19 +591,13 @@ async def tool_browser_drag(
 ) -> ToolResult:
     """Drag from start element to end element."""
     result = ToolResult()
-    timeout = max(500, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms)
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             start_loc = page.locator(start_selector).first
             end_loc = page.locator(end_selector).first
             await start_loc.drag_to(end_loc, timeout=timeout)
             result.add_text(f"Dragged {start_selector} -> {end_selector}\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser drag failed: {e}")
@@ -485,28 +617,34 @@ async def tool_browser_select(
 ) -> ToolResult:
     """Select option(s) in a select element. values: comma-separated values or labels."""
     result = ToolResult()
-    timeout = max(500, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms)
     value_list = [v.strip() for v in values.split(",") if v.strip()]
     if not value_list:
         result.add_error("values must be a non-empty comma-separated list")
         return result
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             locator = page.locator(selector).first
             await locator.select_option(value_list, timeout=timeout)
             result.add_text(f"Selected {value_list} in {selector}\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser select failed: {e}")
         return result
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_fields(fields_json: str) -> tuple[Any, ...] | None:
+    """Parse a browser_fill payload, cached since agents often retry the same one.
+
+    Returns:
+        The array items as a tuple (shared between calls, so never mutated),
+        or None if the JSON is not an array
+    """
+    raw = json.loads(fields_json)
+    return tuple(raw) if isinstance(raw, list) else None
+
+
 @tool(
     name="browser_fill",
     description="Launch a new browser window, navigate to a URL, and fill form fields. Use only when the user explicitly asks to open or launch a browser.",
@@ -519,21 +657,19 @@ async def tool_browser_fill(
 ) -> ToolResult:
     """Fill form fields. Example: [{\"selector\": \"#q\", \"type\": \"text\", \"value\": \"hello\"}, {\"selector\": \"#agree\", \"type\": \"checkbox\", \"value\": true}]."""
     result = ToolResult()
-    timeout = max(500, min(60_000, timeout_ms))
+    timeout = _clamp(timeout_ms)
     try:
-        raw = json.loads(fields_json)
-        if not isinstance(raw, list):
+        raw = _parse_fields(fields_json)
+        if raw is None:
             result.add_error("fields_json must be a JSON array")
             return result
     except json.JSONDecodeError as e:
         result.add_error(f"Invalid JSON: {e}")
         return result
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
+            # one locator per distinct selector, however often the payload repeats it
+            locators: dict[str, Any] = {}
             for item in raw:
                 if not isinstance(item, dict):
                     continue
@@ -541,7 +677,9 @@ async def tool_browser_fill(
                 typ = (item.get("type") or "text").strip().lower()
                 if not sel:
                     continue
-                locator = page.locator(sel).first
+                locator = locators.get(sel)
+                if locator is None:
+                    locator = locators[sel] = page.locator(sel).first
                 if typ in ("checkbox", "radio"):
                     val = item.get("value")
                     checked = val in (True, 1, "1", "true")
@@ -551,8 +689,6 @@ async def tool_browser_fill(
                     text = "" if val is None else str(val)
                     await locator.fill(text, timeout=timeout)
             result.add_text(f"Filled {len(raw)} field(s)\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser fill failed: {e}")
@@ -572,16 +708,10 @@ async def tool_browser_press(
     """Press a key on the page (global, no selector)."""
     result = ToolResult()
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
-            delay = max(0, min(5000, delay_ms))
+        async with _page_lease(url) as page:
+            delay = _clamp(delay_ms, 0, 5000)
             await page.keyboard.press(key, delay=delay)
             result.add_text(f"Pressed key: {key}\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser press failed: {e}")
@@ -602,15 +732,9 @@ async def tool_browser_resize(
     result = ToolResult()
     w, h = max(1, int(width)), max(1, int(height))
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
+        async with _page_lease(url) as page:
             await page.set_viewport_size({"width": w, "height": h})
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
             result.add_text(f"Viewport {w}x{h}\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser resize failed: {e}")
@@ -628,20 +752,14 @@ async def tool_browser_snapshot(
 ) -> ToolResult:
     """Get a text snapshot of the page content."""
     result = ToolResult()
-    limit = max(1000, min(200_000, max_chars))
+    limit = _clamp(max_chars, 1000, 200_000)
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
-            content = await page.evaluate("() => document.body.innerText")
+        async with _page_lease(url, text_only=True, reuse_location=False) as page:
+            content = await page.evaluate(f"__obx_text({limit + 1}, true)")
             text = (content or "").strip()
             if len(text) > limit:
                 text = text[:limit] + "\n\n[... truncated ...]"
             result.add_text(text or "(empty)")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser snapshot failed: {e}")
@@ -667,15 +785,7 @@ async def tool_browser_trace_start(
         result.add_error("Trace already running; call browser_trace_stop first")
         return result
     try:
-        browser = await _get_browser()
-        if not browser.contexts:
-            page = await browser.new_page()
-            await page.close()
-        contexts = browser.contexts
-        if not contexts:
-            result.add_error("No browser context")
-            return result
-        ctx = contexts[0]
+        ctx = await _get_context()
         await ctx.tracing.start(screenshots=screenshots, snapshots=snapshots)
         _trace_active = True
         result.add_text("Trace started")
@@ -700,13 +810,11 @@ async def tool_browser_trace_stop(
         result.add_error("No active trace; call browser_trace_start first")
         return result
     try:
-        browser = await _get_browser()
-        contexts = browser.contexts
-        if not contexts:
+        ctx = _context
+        if ctx is None:
             _trace_active = False
             result.add_error("No browser context")
             return result
-        ctx = contexts[0]
         await ctx.tracing.stop(path=path)
         _trace_active = False
         result.add_text(f"Trace saved to {path}")
@@ -730,23 +838,26 @@ async def tool_browser_download(
 ) -> ToolResult:
     """Wait for a download; optionally click an element to trigger it. Returns path and suggested filename."""
     result = ToolResult()
-    timeout = max(1000, min(120_000, timeout_ms))
+    timeout = _clamp(timeout_ms, 1000, 120_000)
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        # without a click the download comes from loading url, so arm the wait before navigating
+        async with _page_lease(url if click_selector else "about:blank") as page:
             async with page.expect_download(timeout=timeout) as download_info:
                 if click_selector:
                     await page.locator(click_selector).first.click(timeout=timeout)
+                else:
+                    # goto raises once the response turns into a download
+                    with contextlib.suppress(Exception):
+                        await page.goto(url, wait_until="commit", timeout=30000)
             download = await download_info.value
             suggested = getattr(download, "suggested_filename", None) or "download.bin"
-            out_path = save_path or tempfile.mktemp(suffix="-" + suggested)
+            out_path = save_path
+            if not out_path:
+                # reserve the name atomically; mktemp only returns a name another process may take
+                fd, out_path = tempfile.mkstemp(suffix="-" + suggested)
+                os.close(fd)
             await download.save_as(out_path)
             result.add_text(f"Download saved: {out_path}\nSuggested filename: {suggested}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser download failed: {e}")
@@ -762,15 +873,11 @@ async def tool_browser_cookies_get(url: str) -> ToolResult:
     """Get all cookies."""
     result = ToolResult()
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
-            cookies = await page.context.cookies()
-            result.add_text(json.dumps(cookies, indent=2))
-        finally:
-            await page.close()
+        # cookies live on the shared context, so no page or navigation is needed;
+        # only those that would be sent to url are returned
+        context = await _get_context()
+        cookies = await context.cookies(url)
+        result.add_text(json_dumps(cookies))
         return result
     except Exception as e:
         result.add_error(f"Browser cookies get failed: {e}")
@@ -787,18 +894,12 @@ async def tool_browser_cookies_set(
     name: str,
     value: str,
 ) -> ToolResult:
-    """Set one cookie. Navigate to url first so domain is set; then add cookie."""
+    """Set one cookie; its domain and path are derived from url."""
     result = ToolResult()
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
-            await page.context.add_cookies([{"name": name, "value": value, "url": url}])
-            result.add_text(f"Cookie set: {name}\nURL: {url}")
-        finally:
-            await page.close()
+        context = await _get_context()
+        await context.add_cookies([{"name": name, "value": value, "url": url}])
+        result.add_text(f"Cookie set: {name}\nURL: {url}")
         return result
     except Exception as e:
         result.add_error(f"Browser cookies set failed: {e}")
@@ -814,14 +915,9 @@ async def tool_browser_cookies_clear(url: str) -> ToolResult:
     """Clear all cookies."""
     result = ToolResult()
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.context.clear_cookies()
-            result.add_text(f"Cookies cleared\nURL: {url}")
-        finally:
-            await page.close()
+        context = await _get_context()
+        await context.clear_cookies()
+        result.add_text(f"Cookies cleared\nURL: {url}")
         return result
     except Exception as e:
         result.add_error(f"Browser cookies clear failed: {e}")
@@ -844,20 +940,14 @@ async def tool_browser_storage_get(
         result.add_error("kind must be 'local' or 'session'")
         return result
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             script = (
                 "({ kind, key }) => { const s = kind === 'session' ? sessionStorage : localStorage; "
                 "if (key) { const v = s.getItem(key); return v === null ? {} : { [key]: v }; } "
                 "const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); if (k) o[k] = s.getItem(k); } return o; }"
             )
             values = await page.evaluate(script, {"kind": kind, "key": key})
-            result.add_text(json.dumps(values or {}))
-        finally:
-            await page.close()
+            result.add_text(json_dumps(values or {}))
         return result
     except Exception as e:
         result.add_error(f"Browser storage get failed: {e}")
@@ -881,18 +971,12 @@ async def tool_browser_storage_set(
         result.add_error("kind must be 'local' or 'session'")
         return result
     try:
-        browser = await _get_browser()
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+        async with _page_lease(url) as page:
             await page.evaluate(
                 "({ kind, key, value }) => { const s = kind === 'session' ? sessionStorage : localStorage; s.setItem(key, value); }",
                 {"kind": kind, "key": key, "value": value},
             )
             result.add_text(f"Storage set: {kind} {key}\nURL: {url}")
-        finally:
-            await page.close()
         return result
     except Exception as e:
         result.add_error(f"Browser storage set failed: {e}")
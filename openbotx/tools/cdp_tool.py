@@ -8,33 +8,91 @@ Default CDP endpoint: http://127.0.0.1:18792
 """
 
 import asyncio
+import contextlib
+import functools
 import json
+import os
 import tempfile
-from typing import Any
+import weakref
+from collections import deque
+from typing import Any, NamedTuple
 
 from openbotx.core.tools_registry import tool
+from openbotx.helpers.fast_json import json_dumps
 from openbotx.models.tool_result import ToolResult
 
-_cdp_browser: Any = None
+# One Playwright driver hosts a warm connection per normalized endpoint, so switching
+# cdp_url between calls does not tear down and reconnect
 _cdp_playwright: Any = None
-_cdp_endpoint: str | None = None
-
-# Console, errors, requests: key = (endpoint, id(page)) -> list
-_cdp_console_logs: dict[tuple[str, int], list[dict]] = {}
-_cdp_page_errors: dict[tuple[str, int], list[dict]] = {}
-_cdp_requests_log: dict[tuple[str, int], list[dict]] = {}
-_cdp_response_bodies: dict[tuple[str, int], list[dict]] = {}
-_cdp_listeners_attached: set[tuple[str, int]] = set()
+_cdp_playwright_lock = asyncio.Lock()
+_cdp_browsers: dict[str, Any] = {}
+_cdp_connect_locks: dict[str, asyncio.Lock] = {}
+
 _MAX_CONSOLE = 500
 _MAX_ERRORS = 200
 _MAX_REQUESTS = 500
 _MAX_RESPONSE_BODIES = 50
 _MAX_BODY_PREVIEW = 100_000
+_MAX_BODY_FETCHES = 4
+# Only textual bodies are useful as previews; binary ones are never fetched or decoded
+_TEXT_BODY_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/ecmascript",
+    "application/xml",
+    "application/xhtml+xml",
+    "application/x-www-form-urlencoded",
+    "application/graphql",
+)
+_TEXT_BODY_SUFFIXES = ("+json", "+xml")
+
+
+# Log entries are stored as tuples and only turned into dicts when a tool returns them
+class _ConsoleEntry(NamedTuple):
+    type: str
+    text: str
+
+
+class _RequestEntry(NamedTuple):
+    url: str
+    method: str
+
+
+class _PageLogs:
+    """Console messages, page errors, requests and response bodies collected for one page.
+
+    Console, error and request logs are ring buffers that keep the most recent entries,
+    which are the ones that matter when diagnosing the current state of a page.
+    """
+
+    __slots__ = ("console", "errors", "requests", "bodies", "body_worker")
 
-# Next dialog response (one-shot)
-_cdp_next_dialog: dict | None = None
+    def __init__(self) -> None:
+        self.console: deque[_ConsoleEntry] = deque(maxlen=_MAX_CONSOLE)
+        self.errors: deque[str] = deque(maxlen=_MAX_ERRORS)
+        self.requests: deque[_RequestEntry] = deque(maxlen=_MAX_REQUESTS)
+        self.bodies: deque[dict] = deque(maxlen=_MAX_RESPONSE_BODIES)
+        self.body_worker: asyncio.Task[None] | None = None
 
+    def stop(self) -> None:
+        """Cancel the response body worker, if any."""
+        if self.body_worker is not None:
+            self.body_worker.cancel()
+            self.body_worker = None
 
+
+# Pages with listeners attached; entries go away with the page, so closed tabs never
+# leak logs and a recycled id() can never route events to another tab's logs
+_cdp_page_logs: weakref.WeakKeyDictionary[Any, _PageLogs] = weakref.WeakKeyDictionary()
+
+# Armed (accept, prompt_text) dialog responses per page, answered in order by one listener
+_cdp_dialog_queues: weakref.WeakKeyDictionary[Any, deque[tuple[bool, str | None]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@functools.lru_cache(maxsize=32)
 def _normalize_cdp_endpoint(endpoint: str) -> str:
     endpoint = endpoint.strip().rstrip("/")
     if not endpoint.startswith(("http://", "https://", "ws://", "wss://")):
@@ -42,74 +100,80 @@ def _normalize_cdp_endpoint(endpoint: str) -> str:
     return endpoint
 
 
+async def _start_cdp_playwright() -> Any:
+    """Start the Playwright driver shared by all CDP connections (once)."""
+    global _cdp_playwright
+
+    async with _cdp_playwright_lock:
+        if _cdp_playwright is None:
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError:
+                raise RuntimeError(
+                    "Playwright not installed. Install with: pip install playwright && playwright install chromium"
+                )
+            _cdp_playwright = await async_playwright().start()
+        return _cdp_playwright
+
+
 async def _get_cdp_browser(cdp_url: str):
     """Get or create Playwright browser connected over CDP. One connection per endpoint."""
-    global _cdp_browser, _cdp_playwright, _cdp_endpoint
-
     endpoint = _normalize_cdp_endpoint(cdp_url)
-    if _cdp_browser is not None and _cdp_endpoint == endpoint:
-        return _cdp_browser
+    browser = _cdp_browsers.get(endpoint)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    lock = _cdp_connect_locks.setdefault(endpoint, asyncio.Lock())
+    async with lock:
+        # another call may have connected while we waited for the lock
+        browser = _cdp_browsers.get(endpoint)
+        if browser is not None and browser.is_connected():
+            return browser
+        playwright = await _start_cdp_playwright()
+        browser = await playwright.chromium.connect_over_cdp(endpoint)
+        _cdp_browsers[endpoint] = browser
+        return browser
+
 
-    if _cdp_browser is not None:
+async def close_cdp_resources() -> None:
+    """Close CDP browsers and stop Playwright. Call on app shutdown so the Node process exits."""
+    global _cdp_playwright
+
+    for browser in list(_cdp_browsers.values()):
         try:
-            await _cdp_browser.close()
+            await browser.close()
         except Exception:
             pass
-        _cdp_browser = None
+    _cdp_browsers.clear()
+    _cdp_connect_locks.clear()
     if _cdp_playwright is not None:
         try:
             await _cdp_playwright.stop()
         except Exception:
             pass
         _cdp_playwright = None
-    _cdp_listeners_attached.clear()
-    _cdp_console_logs.clear()
-    _cdp_page_errors.clear()
-    _cdp_requests_log.clear()
-    _cdp_response_bodies.clear()
+    _clear_page_logs()
+    _cdp_dialog_queues.clear()
 
-    try:
-        from playwright.async_api import async_playwright
 
-        _cdp_playwright = await async_playwright().start()
-        _cdp_browser = await _cdp_playwright.chromium.connect_over_cdp(endpoint)
-        _cdp_endpoint = endpoint
-        return _cdp_browser
-    except ImportError:
-        raise RuntimeError(
-            "Playwright not installed. Install with: pip install playwright && playwright install chromium"
-        )
+def _clear_page_logs() -> None:
+    """Stop body workers and forget all collected page logs."""
+    for logs in list(_cdp_page_logs.values()):
+        logs.stop()
+    _cdp_page_logs.clear()
 
 
-async def close_cdp_resources() -> None:
-    """Close CDP browser and stop Playwright. Call on app shutdown so the Node process exits."""
-    global _cdp_browser, _cdp_playwright, _cdp_endpoint
-
-    if _cdp_browser is not None:
-        try:
-            await _cdp_browser.close()
-        except Exception:
-            pass
-        _cdp_browser = None
-    if _cdp_playwright is not None:
-        try:
-            await _cdp_playwright.stop()
-        except Exception:
-            pass
-        _cdp_playwright = None
-    _cdp_endpoint = None
-    _cdp_listeners_attached.clear()
-    _cdp_console_logs.clear()
-    _cdp_page_errors.clear()
-    _cdp_requests_log.clear()
-    _cdp_response_bodies.clear()
+def _default_context(browser: Any) -> Any:
+    """Return the browser's default context, or None if it has none."""
+    contexts = browser.contexts
+    return contexts[0] if contexts else None
 
 
 def _get_page(browser, page_index: int = 0):
     """Get page by index from default context. Creates a new page if none exist."""
-    if not browser.contexts:
+    ctx = _default_context(browser)
+    if ctx is None:
         raise RuntimeError("CDP browser has no context")
-    ctx = browser.contexts[0]
     pages = ctx.pages
     if not pages:
         raise RuntimeError(
@@ -119,54 +183,91 @@ def _get_page(browser, page_index: int = 0):
     return pages[idx]
 
 
-def _ensure_cdp_listeners(endpoint: str, page: Any) -> None:
-    """Attach console/error/request listeners to page once per (endpoint, page)."""
-    key = (endpoint, id(page))
-    if key in _cdp_listeners_attached:
-        return
+async def _get_cdp_page(cdp_url: str, page_index: int = 0) -> Any:
+    """Get page by index from the browser connected at cdp_url."""
+    return _get_page(await _get_cdp_browser(cdp_url), page_index)
 
-    if key not in _cdp_console_logs:
-        _cdp_console_logs[key] = []
-    if key not in _cdp_page_errors:
-        _cdp_page_errors[key] = []
-    if key not in _cdp_requests_log:
-        _cdp_requests_log[key] = []
-    if key not in _cdp_response_bodies:
-        _cdp_response_bodies[key] = []
-
-    def on_console(msg: Any) -> None:
-        arr = _cdp_console_logs.get(key)
-        if arr is not None and len(arr) < _MAX_CONSOLE:
-            arr.append({"type": msg.type, "text": msg.text})
-
-    def on_page_error(err: Any) -> None:
-        arr = _cdp_page_errors.get(key)
-        if arr is not None and len(arr) < _MAX_ERRORS:
-            arr.append({"message": str(err)})
-
-    def on_request(req: Any) -> None:
-        arr = _cdp_requests_log.get(key)
-        if arr is not None and len(arr) < _MAX_REQUESTS:
-            arr.append({"url": req.url, "method": req.method})
-
-    async def on_response(resp: Any) -> None:
-        arr = _cdp_response_bodies.get(key)
-        if arr is None or len(arr) >= _MAX_RESPONSE_BODIES:
+
+def _locator(page: Any, selector: str) -> Any:
+    """Return the first-match locator for selector on page.
+
+    Locators are cheap and hold a strong reference to their page, so they are not cached.
+    """
+    return page.locator(selector).first
+
+
+def _ensure_cdp_listeners(page: Any) -> _PageLogs:
+    """Attach console/error/request listeners to page once; return its logs."""
+    logs = _cdp_page_logs.get(page)
+    if logs is not None:
+        return logs
+    logs = _cdp_page_logs[page] = _PageLogs()
+    # the deques are cleared in place, never replaced, so their bound appends stay valid
+    console_append = logs.console.append
+    errors_append = logs.errors.append
+    requests_append = logs.requests.append
+
+    page.on("console", lambda msg: console_append(_ConsoleEntry(msg.type, msg.text)))
+    page.on("pageerror", lambda err: errors_append(str(err)))
+    page.on("request", lambda req: requests_append(_RequestEntry(req.url, req.method)))
+    return logs
+
+
+def _is_text_content_type(content_type: str) -> bool:
+    """Whether a response with this content-type has a body worth previewing as text.
+
+    Responses without a content-type are treated as text, since many API endpoints omit it.
+    """
+    mime = content_type.partition(";")[0].strip().lower()
+    return not mime or mime.startswith(_TEXT_BODY_TYPES) or mime.endswith(_TEXT_BODY_SUFFIXES)
+
+
+async def _capture_body(logs: _PageLogs, resp: Any) -> None:
+    """Fetch one response body and store a text preview of it."""
+    try:
+        body = await resp.body()
+    except Exception:
+        return
+    preview = body[:_MAX_BODY_PREVIEW].decode("utf-8", errors="replace")
+    if len(body) > _MAX_BODY_PREVIEW:
+        preview += "\n... truncated"
+    logs.bodies.append({"url": resp.url, "status": resp.status, "body": preview})
+
+
+async def _body_worker(logs: _PageLogs, queue: asyncio.Queue[Any]) -> None:
+    """Drain queued responses, fetching up to _MAX_BODY_FETCHES bodies at a time."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _MAX_BODY_FETCHES and not queue.empty():
+            batch.append(queue.get_nowait())
+        await asyncio.gather(*(_capture_body(logs, resp) for resp in batch))
+
+
+def _ensure_body_capture(page: Any) -> _PageLogs:
+    """Start capturing response bodies for page (once) on top of its cheap listeners.
+
+    Every captured body is copied over the CDP connection, so this only runs for
+    callers that asked for bodies and skips binary content types. Responses are
+    queued for a single worker task instead of spawning a task per response.
+    """
+    logs = _ensure_cdp_listeners(page)
+    if logs.body_worker is not None:
+        return logs
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_MAX_RESPONSE_BODIES)
+    logs.body_worker = asyncio.create_task(_body_worker(logs, queue))
+
+    def on_response(resp: Any) -> None:
+        # fetching a body is the expensive part, so stop once the buffer is full
+        if len(logs.bodies) >= _MAX_RESPONSE_BODIES:
             return
-        try:
-            body = await resp.body()
-            preview = body[:_MAX_BODY_PREVIEW].decode("utf-8", errors="replace")
-            if len(body) > _MAX_BODY_PREVIEW:
-                preview += "\n... truncated"
-            arr.append({"url": resp.url, "status": resp.status, "body": preview})
-        except Exception:
-            pass
+        if not _is_text_content_type(resp.headers.get("content-type", "")):
+            return
+        with contextlib.suppress(asyncio.QueueFull):
+            queue.put_nowait(resp)
 
-    page.on("console", on_console)
-    page.on("pageerror", on_page_error)
-    page.on("request", on_request)
-    page.on("response", lambda r: asyncio.create_task(on_response(r)))
-    _cdp_listeners_attached.add(key)
+    page.on("response", on_response)
+    page.on("close", lambda _: logs.stop())
+    return logs
 
 
 @tool(
@@ -178,20 +279,19 @@ async def tool_cdp_tabs(cdp_url: str = "http://127.0.0.1:18792") -> ToolResult:
     """List tabs from the CDP-connected browser."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_text("No context (no tabs)")
             return result
-        ctx = browser.contexts[0]
         pages = ctx.pages
+        # each title is a round trip to a different target, so fetch them concurrently
+        titles = await asyncio.gather(*(p.title() for p in pages), return_exceptions=True)
         lines = []
-        for i, p in enumerate(pages):
-            try:
-                title = await p.title()
-                url = p.url
-                lines.append(f"{i}. {title or '(no title)'} | {url}")
-            except Exception:
+        for i, (p, title) in enumerate(zip(pages, titles)):
+            if isinstance(title, Exception):
                 lines.append(f"{i}. (unable to read)")
+            else:
+                lines.append(f"{i}. {title or '(no title)'} | {p.url}")
         result.add_text("\n".join(lines) if lines else "No tabs")
         return result
     except Exception as e:
@@ -211,8 +311,10 @@ async def tool_cdp_new_tab(
     """Open a new tab; optionally goto url. Over relay, new_page() may fail: ask user to open a tab, then use cdp_tabs and cdp_navigate."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        ctx = browser.contexts[0]
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
+            result.add_error("No context")
+            return result
         try:
             page = await ctx.new_page()
         except Exception as e:
@@ -246,8 +348,7 @@ async def tool_cdp_navigate(
     """Navigate the selected tab to url."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         await page.goto(url, wait_until=wait_until, timeout=30000)
         result.add_text(f"Navigated to {url}\nCurrent: {page.url}")
         return result
@@ -256,6 +357,13 @@ async def tool_cdp_navigate(
         return result
 
 
+# Truncate in the page so only the requested text crosses the CDP connection
+_SNAPSHOT_SCRIPT = """(limit) => {
+    const text = (document.body.innerText || "").trim();
+    return [text.slice(0, limit), text.length];
+}"""
+
+
 @tool(
     name="cdp_snapshot",
     description="Get text snapshot of the current page (truncated to max_chars, default 12000). Use after cdp_navigate to read page content; prefer over browser_* unless user asks to open a new browser.",
@@ -270,17 +378,12 @@ async def tool_cdp_snapshot(
     result = ToolResult()
     limit = max(1000, min(200_000, max_chars))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        content = await page.evaluate("() => document.body.innerText")
-        text = (content or "").strip()
-        truncated = len(text) > limit
-        if truncated:
+        page = await _get_cdp_page(cdp_url, page_index)
+        text, total = await page.evaluate(_SNAPSHOT_SCRIPT, limit)
+        if total > limit:
             text = (
-                text[:limit]
-                + "\n\n[... truncated, "
-                + str(len(text) - limit)
-                + " chars omitted; use max_chars to get more ...]"
+                f"{text}\n\n[... truncated, {total - limit} chars omitted;"
+                " use max_chars to get more ...]"
             )
         result.add_text(text or "(empty)")
         return result
@@ -302,10 +405,9 @@ async def tool_cdp_screenshot(
     """Capture screenshot of the page."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            path = f.name
+        page = await _get_cdp_page(cdp_url, page_index)
+        fd, path = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
         await page.screenshot(path=path, full_page=full_page)
         title = await page.title()
         result.add_image(path=path)
@@ -332,9 +434,8 @@ async def tool_cdp_click(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        locator = page.locator(selector).first
+        page = await _get_cdp_page(cdp_url, page_index)
+        locator = _locator(page, selector)
         if double_click:
             await locator.dblclick(timeout=timeout)
         else:
@@ -363,9 +464,8 @@ async def tool_cdp_type(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        locator = page.locator(selector).first
+        page = await _get_cdp_page(cdp_url, page_index)
+        locator = _locator(page, selector)
         await locator.fill(text, timeout=timeout)
         if submit:
             await locator.press("Enter", timeout=timeout)
@@ -389,8 +489,7 @@ async def tool_cdp_press(
     """Press a keyboard key (e.g. Enter, Tab, Escape)."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         await page.keyboard.press(key)
         result.add_text(f"Pressed key: {key}")
         return result
@@ -414,9 +513,8 @@ async def tool_cdp_hover(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        await page.locator(selector).first.hover(timeout=timeout)
+        page = await _get_cdp_page(cdp_url, page_index)
+        await _locator(page, selector).hover(timeout=timeout)
         result.add_text(f"Hovered: {selector}")
         return result
     except Exception as e:
@@ -424,6 +522,11 @@ async def tool_cdp_hover(
         return result
 
 
+# Constant sources with the deltas passed as arguments, so V8 reuses the compiled code
+_SCROLL_ELEMENT_SCRIPT = "(el, [x, y]) => el.scrollBy(x, y)"
+_SCROLL_WINDOW_SCRIPT = "([x, y]) => window.scrollBy(x, y)"
+
+
 @tool(
     name="cdp_scroll",
     description="Scroll the page or an element.",
@@ -439,13 +542,12 @@ async def tool_cdp_scroll(
     """Scroll: use selector for element, or leave empty for viewport. delta_x/delta_y in pixels."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         if selector:
-            await page.locator(selector).first.evaluate(f"el => el.scrollBy({delta_x}, {delta_y})")
+            await _locator(page, selector).evaluate(_SCROLL_ELEMENT_SCRIPT, [delta_x, delta_y])
             result.add_text(f"Scrolled element {selector} by ({delta_x}, {delta_y})")
         else:
-            await page.evaluate(f"window.scrollBy({delta_x}, {delta_y})")
+            await page.evaluate(_SCROLL_WINDOW_SCRIPT, [delta_x, delta_y])
             result.add_text(f"Scrolled page by ({delta_x}, {delta_y})")
         return result
     except Exception as e:
@@ -453,6 +555,14 @@ async def tool_cdp_scroll(
         return result
 
 
+@functools.lru_cache(maxsize=128)
+def _evaluate_source(script: str) -> str:
+    """Wrap a cdp_evaluate script in a function, adding return for bare expressions."""
+    s = script.strip()
+    body = s if "return " in s else f"return {s}"
+    return f"() => {{ {body} }}"
+
+
 @tool(
     name="cdp_evaluate",
     description="Run JavaScript in the page. Returns JSON-serializable result.",
@@ -466,13 +576,10 @@ async def tool_cdp_evaluate(
     """Execute script in the page. Use return for a value."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        s = script.strip()
-        body = s if "return " in s else f"return {s}"
-        value = await page.evaluate(f"() => {{ {body} }}")
+        page = await _get_cdp_page(cdp_url, page_index)
+        value = await page.evaluate(_evaluate_source(script))
         if value is not None:
-            result.add_text(json.dumps(value) if not isinstance(value, str) else value)
+            result.add_text(json_dumps(value) if not isinstance(value, str) else value)
         else:
             result.add_text("ok")
         return result
@@ -496,10 +603,9 @@ async def tool_cdp_wait(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         if selector:
-            await page.locator(selector).first.wait_for(state="visible", timeout=timeout)
+            await _locator(page, selector).wait_for(state="visible", timeout=timeout)
             result.add_text(f"Element visible: {selector}")
         else:
             await asyncio.sleep(timeout / 1000)
@@ -526,10 +632,9 @@ async def tool_cdp_drag(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        start_loc = page.locator(start_selector).first
-        end_loc = page.locator(end_selector).first
+        page = await _get_cdp_page(cdp_url, page_index)
+        start_loc = _locator(page, start_selector)
+        end_loc = _locator(page, end_selector)
         await start_loc.drag_to(end_loc, timeout=timeout)
         result.add_text(f"Dragged {start_selector} -> {end_selector}")
         return result
@@ -558,9 +663,8 @@ async def tool_cdp_select(
         result.add_error("values must be non-empty comma-separated list")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        await page.locator(selector).first.select_option(value_list, timeout=timeout)
+        page = await _get_cdp_page(cdp_url, page_index)
+        await _locator(page, selector).select_option(value_list, timeout=timeout)
         result.add_text(f"Selected {value_list} in {selector}")
         return result
     except Exception as e:
@@ -591,8 +695,7 @@ async def tool_cdp_fill(
         result.add_error(f"Invalid JSON: {e}")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         for item in raw:
             if not isinstance(item, dict):
                 continue
@@ -600,7 +703,7 @@ async def tool_cdp_fill(
             typ = (item.get("type") or "text").strip().lower()
             if not sel:
                 continue
-            locator = page.locator(sel).first
+            locator = _locator(page, sel)
             if typ in ("checkbox", "radio"):
                 val = item.get("value")
                 checked = val in (True, 1, "1", "true")
@@ -631,8 +734,7 @@ async def tool_cdp_resize(
     result = ToolResult()
     w, h = max(1, int(width)), max(1, int(height))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         await page.set_viewport_size({"width": w, "height": h})
         result.add_text(f"Viewport set to {w}x{h}")
         return result
@@ -653,11 +755,10 @@ async def tool_cdp_close_tab(
     """Close the tab at page_index. At least one tab must remain."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         pages = ctx.pages
         if len(pages) <= 1:
             result.add_error("Cannot close the only tab")
@@ -686,11 +787,10 @@ async def tool_cdp_screenshot_element(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        locator = page.locator(selector).first
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            path = f.name
+        page = await _get_cdp_page(cdp_url, page_index)
+        locator = _locator(page, selector)
+        fd, path = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
         await locator.screenshot(path=path, timeout=timeout)
         result.add_image(path=path)
         result.add_text(f"Screenshot of element: {selector}")
@@ -716,11 +816,10 @@ async def tool_cdp_download(
     result = ToolResult()
     timeout = max(1000, min(120_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         async with page.expect_download(timeout=timeout) as download_info:
             if click_selector:
-                await page.locator(click_selector).first.click(timeout=timeout)
+                await _locator(page, click_selector).click(timeout=timeout)
         download = await download_info.value
         suggested = getattr(download, "suggested_filename", None) or "download.bin"
         out_path = save_path or tempfile.mktemp(suffix="-" + suggested)
@@ -752,11 +851,10 @@ async def tool_cdp_trace_start(
         result.add_error("Trace already running; call cdp_trace_stop first")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.tracing.start(screenshots=screenshots, snapshots=snapshots)
         _cdp_trace_active = True
         result.add_text("Trace started")
@@ -782,12 +880,11 @@ async def tool_cdp_trace_stop(
         result.add_error("No active trace; call cdp_trace_start first")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             _cdp_trace_active = False
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.tracing.stop(path=path)
         _cdp_trace_active = False
         result.add_text(f"Trace saved to {path}")
@@ -809,13 +906,12 @@ async def tool_cdp_cookies_get(
     """Get all cookies."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         cookies = await ctx.cookies()
-        result.add_text(json.dumps(cookies, indent=2))
+        result.add_text(json_dumps(cookies))
         return result
     except Exception as e:
         result.add_error(f"CDP cookies get failed: {e}")
@@ -836,11 +932,10 @@ async def tool_cdp_cookies_set(
     """Set one cookie; url is required for domain."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.add_cookies([{"name": name, "value": value, "url": url}])
         result.add_text(f"Cookie set: {name}")
         return result
@@ -860,11 +955,10 @@ async def tool_cdp_cookies_clear(
     """Clear all cookies in the context."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.clear_cookies()
         result.add_text("Cookies cleared")
         return result
@@ -884,21 +978,28 @@ async def tool_cdp_storage_get(
     cdp_url: str = "http://127.0.0.1:18792",
     page_index: int = 0,
 ) -> ToolResult:
-    """Get storage. kind: 'local' or 'session'. key: optional single key."""
+    """Get storage. kind: 'local' or 'session'. key: optional single key, returned raw."""
     result = ToolResult()
     if kind not in ("local", "session"):
         result.add_error("kind must be 'local' or 'session'")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         script = (
             "({ kind, key }) => { const s = kind === 'session' ? sessionStorage : localStorage; "
-            "if (key) { const v = s.getItem(key); return v === null ? {} : { [key]: v }; } "
+            "if (key) return s.getItem(key); "
             "const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); if (k) o[k] = s.getItem(k); } return o; }"
         )
         values = await page.evaluate(script, {"kind": kind, "key": key})
-        result.add_text(json.dumps(values or {}))
+        if key:
+            # a single value needs no JSON wrapping; an unset key is an error, not text
+            # that could be mistaken for a stored value
+            if values is None:
+                result.add_error(f"Key not set in {kind} storage: {key}")
+            else:
+                result.add_text(values)
+        else:
+            result.add_text(json_dumps(values or {}))
         return result
     except Exception as e:
         result.add_error(f"CDP storage get failed: {e}")
@@ -923,8 +1024,7 @@ async def tool_cdp_storage_set(
         result.add_error("kind must be 'local' or 'session'")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         await page.evaluate(
             "({ kind, key, value }) => { const s = kind === 'session' ? sessionStorage : localStorage; s.setItem(key, value); }",
             {"kind": kind, "key": key, "value": value},
@@ -951,9 +1051,8 @@ async def tool_cdp_highlight(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        await page.locator(selector).first.highlight(timeout=timeout)
+        page = await _get_cdp_page(cdp_url, page_index)
+        await _locator(page, selector).highlight(timeout=timeout)
         result.add_text(f"Highlighted: {selector}")
         return result
     except Exception as e:
@@ -961,6 +1060,35 @@ async def tool_cdp_highlight(
         return result
 
 
+# Constant source with limit/maxText passed as arguments, so V8 reuses the compiled code;
+# lines are formatted in the page so per-node objects never cross the CDP connection
+_SNAPSHOT_DOM_SCRIPT = """([limit, maxText]) => {
+  const lines = [];
+  const refToSelector = {};
+  const root = document.body || document.documentElement;
+  if (!root) return { lines: '', refToSelector: {} };
+  const stack = [{ el: root, depth: 0 }];
+  while (stack.length && lines.length < limit) {
+    const { el, depth } = stack.pop();
+    if (!el || el.nodeType !== 1) continue;
+    const ref = 'n' + (lines.length + 1);
+    const tag = (el.tagName || '').toLowerCase();
+    let text = '';
+    try { text = (el.innerText || '').trim().slice(0, maxText); } catch {}
+    const role = el.getAttribute?.('role') || '';
+    const name = el.getAttribute?.('aria-label') || el.title || '';
+    const id = el.id ? '#' + el.id : '';
+    const sel = tag + (id || (el.className ? '.' + String(el.className).split(/\\s+/)[0] : ''));
+    const parts = [ref, tag, role, name, text.slice(0, 80)].filter(Boolean);
+    lines.push('  '.repeat(depth) + parts.join(' | '));
+    refToSelector[ref] = sel;
+    const children = el.children ? Array.from(el.children) : [];
+    for (let i = children.length - 1; i >= 0; i--) stack.push({ el: children[i], depth: depth + 1 });
+  }
+  return { lines: lines.join('\\n'), refToSelector };
+}"""
+
+
 @tool(
     name="cdp_snapshot_dom",
     description="Get DOM snapshot with refs (ref=selector map) for interactive elements.",
@@ -976,53 +1104,13 @@ async def tool_cdp_snapshot_dom(
     result = ToolResult()
     limit = max(1, min(2000, limit))
     max_text = max(0, min(1000, max_text))
-    for_each_js = "refToSelector[n.ref] = n.selector;"
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        script = f"""
-        (() => {{
-          const limit = {limit};
-          const maxText = {max_text};
-          const nodes = [];
-          const root = document.body || document.documentElement;
-          if (!root) return {{ nodes: [], refToSelector: {{}} }};
-          const stack = [{{ el: root, depth: 0 }}];
-          while (stack.length && nodes.length < limit) {{
-            const {{ el, depth }} = stack.pop();
-            if (!el || el.nodeType !== 1) continue;
-            const ref = 'n' + (nodes.length + 1);
-            const tag = (el.tagName || '').toLowerCase();
-            let text = '';
-            try {{ text = (el.innerText || '').trim().slice(0, maxText); }} catch {{}}
-            const role = el.getAttribute?.('role') || '';
-            const name = el.getAttribute?.('aria-label') || el.title || '';
-            const id = el.id ? '#' + el.id : '';
-            const sel = tag + (id || (el.className ? '.' + String(el.className).split(/\\s+/)[0] : ''));
-            nodes.push({{ ref, depth, tag, role, name, text: text || undefined, selector: sel }});
-            const children = el.children ? Array.from(el.children) : [];
-            for (let i = children.length - 1; i >= 0; i--) stack.push({{ el: children[i], depth: depth + 1 }});
-          }}
-          const refToSelector = {{}};
-          nodes.forEach(n => {{ {for_each_js} }});
-          return {{ nodes, refToSelector }};
-        }})()
-        """
-        data = await page.evaluate(script)
-        nodes = data.get("nodes", [])
+        page = await _get_cdp_page(cdp_url, page_index)
+        data = await page.evaluate(_SNAPSHOT_DOM_SCRIPT, [limit, max_text])
         ref_to_sel = data.get("refToSelector", {})
-        lines = []
-        for n in nodes:
-            indent = "  " * n.get("depth", 0)
-            parts = [
-                n.get("ref", ""),
-                n.get("tag", ""),
-                n.get("role", ""),
-                n.get("name", ""),
-                (n.get("text") or "")[:80],
-            ]
-            lines.append(indent + " | ".join(p for p in parts if p))
-        result.add_text("\n".join(lines) + "\n\nrefToSelector: " + json.dumps(ref_to_sel)[:2000])
+        result.add_text(
+            data.get("lines", "") + "\n\nrefToSelector: " + json.dumps(ref_to_sel)[:2000]
+        )
         return result
     except Exception as e:
         result.add_error(f"CDP snapshot dom failed: {e}")
@@ -1044,9 +1132,8 @@ async def tool_cdp_scroll_into_view(
     result = ToolResult()
     timeout = max(500, min(60_000, timeout_ms))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        await page.locator(selector).first.scroll_into_view_if_needed(timeout=timeout)
+        page = await _get_cdp_page(cdp_url, page_index)
+        await _locator(page, selector).scroll_into_view_if_needed(timeout=timeout)
         result.add_text(f"Scrolled into view: {selector}")
         return result
     except Exception as e:
@@ -1066,11 +1153,10 @@ async def tool_cdp_set_offline(
     """Enable or disable offline mode."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.set_offline(offline)
         result.add_text(f"Offline mode: {offline}")
         return result
@@ -1095,11 +1181,10 @@ async def tool_cdp_set_headers(
         if not isinstance(headers, dict):
             result.add_error("headers_json must be a JSON object")
             return result
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.set_extra_http_headers({k: str(v) for k, v in headers.items()})
         result.add_text(f"Headers set: {list(headers.keys())}")
         return result
@@ -1124,11 +1209,10 @@ async def tool_cdp_set_credentials(
     """Set HTTP auth credentials for the context."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.set_http_credentials({"username": username, "password": password})
         result.add_text("Credentials set")
         return result
@@ -1148,11 +1232,10 @@ async def tool_cdp_set_credentials_clear(
     """Clear HTTP auth credentials."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.set_http_credentials(None)
         result.add_text("Credentials cleared")
         return result
@@ -1175,16 +1258,15 @@ async def tool_cdp_set_geo(
     """Set geolocation (lat, lon, optional accuracy in meters)."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         opts: dict = {"latitude": latitude, "longitude": longitude}
         if accuracy is not None:
             opts["accuracy"] = accuracy
-        await ctx.grant_permissions(["geolocation"])
-        await ctx.set_geolocation(opts)
+        # independent context settings, so send both at once
+        await asyncio.gather(ctx.grant_permissions(["geolocation"]), ctx.set_geolocation(opts))
         result.add_text(f"Geo set: {latitude}, {longitude}")
         return result
     except Exception as e:
@@ -1203,11 +1285,10 @@ async def tool_cdp_set_geo_clear(
     """Clear geolocation and geolocation permission."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.set_geolocation(None)
         try:
             await ctx.clear_permissions()
@@ -1232,11 +1313,10 @@ async def tool_cdp_set_locale(
     """Set locale (e.g. en-US, pt-BR) via Accept-Language."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        if not browser.contexts:
+        ctx = _default_context(await _get_cdp_browser(cdp_url))
+        if ctx is None:
             result.add_error("No context")
             return result
-        ctx = browser.contexts[0]
         await ctx.set_extra_http_headers({"Accept-Language": locale})
         result.add_text(f"Locale set: {locale}")
         return result
@@ -1266,11 +1346,13 @@ async def tool_cdp_set_device(
             )
             return result
         page = _get_page(browser, page_index)
+        updates = []
         if device.get("viewport"):
-            await page.set_viewport_size(device["viewport"])
+            updates.append(page.set_viewport_size(device["viewport"]))
         if device.get("user_agent"):
-            ctx = browser.contexts[0]
-            await ctx.set_extra_http_headers({"User-Agent": device["user_agent"]})
+            headers = {"User-Agent": device["user_agent"]}
+            updates.append(page.context.set_extra_http_headers(headers))
+        await asyncio.gather(*updates)
         result.add_text(f"Device set: {device_name}")
         return result
     except Exception as e:
@@ -1291,8 +1373,7 @@ async def tool_cdp_pdf(
     """Save page as PDF to the given path."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         await page.pdf(path=path)
         result.add_text(f"PDF saved to {path}")
         return result
@@ -1301,6 +1382,16 @@ async def tool_cdp_pdf(
         return result
 
 
+async def _answer_dialog(pending: deque[tuple[bool, str | None]], dialog: Any) -> None:
+    """Answer a dialog with the oldest armed response for its page."""
+    # with nothing armed, dismiss as Playwright does for pages without dialog listeners
+    accept, prompt_text = pending.popleft() if pending else (False, None)
+    if accept:
+        await dialog.accept(prompt_text)
+    else:
+        await dialog.dismiss()
+
+
 @tool(
     name="cdp_dialog_respond",
     description="Set response for the next JavaScript dialog (alert/confirm/prompt). Call before the action that opens the dialog.",
@@ -1313,22 +1404,17 @@ async def tool_cdp_dialog_respond(
     page_index: int = 0,
 ) -> ToolResult:
     """Arm next dialog: accept=True/False, prompt_text for prompt()."""
-    global _cdp_next_dialog
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-
-        async def handle_dialog(dialog: Any) -> None:
-            if accept:
-                await dialog.accept(prompt_text)
-            else:
-                await dialog.dismiss()
-
-        page.once("dialog", handle_dialog)
-        _cdp_next_dialog = {"accept": accept, "prompt_text": prompt_text}
+        page = await _get_cdp_page(cdp_url, page_index)
+        pending = _cdp_dialog_queues.get(page)
+        if pending is None:
+            pending = _cdp_dialog_queues[page] = deque()
+            page.on("dialog", functools.partial(_answer_dialog, pending))
+        pending.append((accept, prompt_text))
+        which = "Next dialog" if len(pending) == 1 else f"Dialog {len(pending)} from now"
         result.add_text(
-            f"Next dialog will be {'accepted' if accept else 'dismissed'}"
+            f"{which} will be {'accepted' if accept else 'dismissed'}"
             + (" with prompt_text" if prompt_text else "")
         )
         return result
@@ -1354,8 +1440,7 @@ async def tool_cdp_upload_arm(
         result.add_error("paths must be non-empty comma-separated list")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
 
         async def handle_file_chooser(chooser: Any) -> None:
             await chooser.set_files(path_list)
@@ -1372,21 +1457,26 @@ async def tool_cdp_upload_arm(
 
 @tool(
     name="cdp_console_start",
-    description="Start collecting console messages, page errors, and requests for this tab.",
+    description="Start collecting console messages, page errors, and requests for this tab. Set capture_bodies=true to also collect response bodies for cdp_response_body.",
     security={"approval_required": False, "dangerous": False},
 )
 async def tool_cdp_console_start(
     cdp_url: str = "http://127.0.0.1:18792",
     page_index: int = 0,
+    capture_bodies: bool = False,
 ) -> ToolResult:
     """Start collecting console/errors/requests. Then use cdp_console_get, cdp_errors_get, cdp_requests_get."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        endpoint = _normalize_cdp_endpoint(cdp_url)
-        _ensure_cdp_listeners(endpoint, page)
-        result.add_text("Collecting console, errors, and requests for this tab.")
+        page = await _get_cdp_page(cdp_url, page_index)
+        if capture_bodies:
+            _ensure_body_capture(page)
+            result.add_text(
+                "Collecting console, errors, requests, and response bodies for this tab."
+            )
+        else:
+            _ensure_cdp_listeners(page)
+            result.add_text("Collecting console, errors, and requests for this tab.")
         return result
     except Exception as e:
         result.add_error(f"CDP console start failed: {e}")
@@ -1406,15 +1496,11 @@ async def tool_cdp_console_get(
     """Return collected console messages. clear=True to reset after returning."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        endpoint = _normalize_cdp_endpoint(cdp_url)
-        _ensure_cdp_listeners(endpoint, page)
-        key = (endpoint, id(page))
-        messages = _cdp_console_logs.get(key, [])
-        result.add_text(json.dumps(messages, indent=2))
+        page = await _get_cdp_page(cdp_url, page_index)
+        logs = _ensure_cdp_listeners(page)
+        result.add_text(json_dumps([e._asdict() for e in logs.console]))
         if clear:
-            _cdp_console_logs[key] = []
+            logs.console.clear()
         return result
     except Exception as e:
         result.add_error(f"CDP console get failed: {e}")
@@ -1434,15 +1520,11 @@ async def tool_cdp_errors_get(
     """Return collected page errors."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        endpoint = _normalize_cdp_endpoint(cdp_url)
-        _ensure_cdp_listeners(endpoint, page)
-        key = (endpoint, id(page))
-        errors = _cdp_page_errors.get(key, [])
-        result.add_text(json.dumps(errors, indent=2))
+        page = await _get_cdp_page(cdp_url, page_index)
+        logs = _ensure_cdp_listeners(page)
+        result.add_text(json_dumps([{"message": m} for m in logs.errors]))
         if clear:
-            _cdp_page_errors[key] = []
+            logs.errors.clear()
         return result
     except Exception as e:
         result.add_error(f"CDP errors get failed: {e}")
@@ -1462,15 +1544,11 @@ async def tool_cdp_requests_get(
     """Return collected requests (url, method)."""
     result = ToolResult()
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        endpoint = _normalize_cdp_endpoint(cdp_url)
-        _ensure_cdp_listeners(endpoint, page)
-        key = (endpoint, id(page))
-        requests = _cdp_requests_log.get(key, [])
-        result.add_text(json.dumps(requests, indent=2))
+        page = await _get_cdp_page(cdp_url, page_index)
+        logs = _ensure_cdp_listeners(page)
+        result.add_text(json_dumps([e._asdict() for e in logs.requests]))
         if clear:
-            _cdp_requests_log[key] = []
+            logs.requests.clear()
         return result
     except Exception as e:
         result.add_error(f"CDP requests get failed: {e}")
@@ -1479,7 +1557,7 @@ async def tool_cdp_requests_get(
 
 @tool(
     name="cdp_response_body",
-    description="Get response body for a URL pattern from collected responses (call cdp_console_start first).",
+    description="Get response body for a URL pattern from collected responses (call cdp_console_start with capture_bodies=true first).",
     security={"approval_required": False, "dangerous": False},
 )
 async def tool_cdp_response_body(
@@ -1488,25 +1566,23 @@ async def tool_cdp_response_body(
     page_index: int = 0,
     max_chars: int = 10000,
 ) -> ToolResult:
-    """Return body of first response whose URL contains url_pattern. Requires cdp_console_start."""
+    """Return body of first response whose URL contains url_pattern. Requires body capture."""
     result = ToolResult()
     max_chars = max(0, min(500_000, max_chars))
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
-        endpoint = _normalize_cdp_endpoint(cdp_url)
-        _ensure_cdp_listeners(endpoint, page)
-        key = (endpoint, id(page))
-        bodies = _cdp_response_bodies.get(key, [])
-        for b in bodies:
-            if url_pattern in b.get("url", ""):
-                text = b.get("body", "")[:max_chars]
-                if len(b.get("body", "")) > max_chars:
+        page = await _get_cdp_page(cdp_url, page_index)
+        logs = _ensure_body_capture(page)
+        for b in logs.bodies:
+            if url_pattern in b["url"]:
+                body = b["body"]
+                text = body[:max_chars]
+                if len(body) > max_chars:
                     text += "\n... truncated"
                 result.add_text(text)
                 return result
         result.add_text(
-            "No matching response body found. Call cdp_console_start and trigger the request."
+            "No matching response body found. Response bodies are now being captured;"
+            " trigger the request and try again."
         )
         return result
     except Exception as e:
@@ -1530,8 +1606,7 @@ async def tool_cdp_storage_clear(
         result.add_error("kind must be 'local' or 'session'")
         return result
     try:
-        browser = await _get_cdp_browser(cdp_url)
-        page = _get_page(browser, page_index)
+        page = await _get_cdp_page(cdp_url, page_index)
         await page.evaluate(
             "({ kind }) => { const s = kind === 'session' ? sessionStorage : localStorage; s.clear(); }",
             {"kind": kind},
@@ -58,15 +58,12 @@ async def tool_memory_search(
 
         # format results
         output_lines = [f"Found {len(results)} relevant result(s):\n"]
-
-        for i, r in enumerate(results, 1):
-            output_lines.append(f"## Result {i}: {r.path}")
-            output_lines.append(f"**Lines {r.start_line}-{r.end_line}** | Score: {r.score:.2f}")
-            output_lines.append("")
-            output_lines.append(r.snippet)
-            output_lines.append("")
-            output_lines.append("---")
-            output_lines.append("")
+        output_lines.extend(
+            f"## Result {i}: {r.path}\n"
+            f"**Lines {r.start_line}-{r.end_line}** | Score: {r.score:.2f}\n\n"
+            f"{r.snippet}\n\n---\n"
+            for i, r in enumerate(results, 1)
+        )
 
         result.add_text("\n".join(output_lines))
         return result